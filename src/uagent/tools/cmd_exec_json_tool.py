@@ -80,6 +80,40 @@ def _blocked_result(reason: str) -> dict[str, Any]:
     }
 
 
+def _completed_result(p: subprocess.CompletedProcess) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "ok": p.returncode == 0,
+        "returncode": p.returncode,
+        "stdout": p.stdout,
+        "stderr": p.stderr,
+    }
+    if not result["ok"]:
+        result["error"] = (p.stderr or "").strip() or _(
+            "error.exit_code", default="command exited with code %(returncode)s"
+        ) % {"returncode": p.returncode}
+    return result
+
+
+def _exec_error_result(e: Exception) -> dict[str, Any]:
+    if isinstance(e, OSError):
+        error = _(
+            "error.os_error",
+            default="command execution failed (OS error): %(error)s",
+        ) % {"error": str(e)}
+    else:
+        error = _(
+            "error.exec_failed",
+            default="command execution failed: %(error)s",
+        ) % {"error": str(e)}
+    return {
+        "ok": False,
+        "returncode": -1,
+        "stdout": "",
+        "stderr": str(e),
+        "error": error,
+    }
+
+
 def _run(command: str, cwd: Optional[str]) -> dict[str, Any]:
     try:
         if os.name == "nt":
@@ -116,41 +150,9 @@ def _run(command: str, cwd: Optional[str]) -> dict[str, Any]:
                 cwd=cwd,
             )
 
-        result: dict[str, Any] = {
-            "ok": p.returncode == 0,
-            "returncode": p.returncode,
-            "stdout": p.stdout,
-            "stderr": p.stderr,
-        }
-        if not result["ok"]:
-            result["error"] = (p.stderr or "").strip() or _(
-                "error.exit_code", default="command exited with code %(returncode)s"
-            ) % {"returncode": p.returncode}
-        return result
-    except OSError as e:
-        return {
-            "ok": False,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": str(e),
-            "error": _(
-                "error.os_error",
-                default="command execution failed (OS error): %(error)s",
-            )
-            % {"error": str(e)},
-        }
+        return _completed_result(p)
     except Exception as e:
-        return {
-            "ok": False,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": str(e),
-            "error": _(
-                "error.exec_failed",
-                default="command execution failed: %(error)s",
-            )
-            % {"error": str(e)},
-        }
+        return _exec_error_result(e)
 
 
 def run_tool(args: dict[str, Any]) -> str:
@@ -178,3 +180,44 @@ def run_tool(args: dict[str, Any]) -> str:
 
     out = _run(command, cwd)
     return json.dumps(out, ensure_ascii=False)
+
+
+def run_argv(argv: list[str], cwd: Optional[str] = None) -> str:
+    """Run argv without a shell and return the same JSON as run_tool.
+
+    For internal callers that already hold an argument vector (e.g.
+    lint_format). The command policy is checked against the quoted command
+    line; cwd follows the same workdir rule as run_tool.
+    """
+    argv = [str(a) for a in argv]
+    if not argv:
+        raise ValueError("argv is required")
+
+    if os.name == "nt":
+        command = subprocess.list2cmdline(argv)
+    else:
+        command = shlex.join(argv)
+    decision = decide_cmd_exec(command, require_confirm_for_shell_metachar=False)
+    if not decision.allowed:
+        return json.dumps(_blocked_result(decision.reason), ensure_ascii=False)
+
+    confirm_err = confirm_if_needed(decision)
+    if confirm_err is not None:
+        return json.dumps(_blocked_result(confirm_err), ensure_ascii=False)
+
+    run_cwd = ensure_within_workdir(cwd) if cwd else None
+    try:
+        p = subprocess.run(
+            argv,
+            shell=False,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=run_cwd,
+        )
+        out = _completed_result(p)
+    except Exception as e:
+        out = _exec_error_result(e)
+    return json.dumps(out, ensure_ascii=False)
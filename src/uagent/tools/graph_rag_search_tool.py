@@ -12,6 +12,7 @@ _ = make_tool_translator(__file__)
 
 import ast
 import glob
+import io
 import json
 import os
 import re
@@ -886,6 +887,22 @@ def _graph_retrieve(
     return out, trace
 
 
+_TRACE_DUMP_CHARS = 4000
+
+
+def _dump_trace(trace: dict[str, Any], limit: int = _TRACE_DUMP_CHARS) -> str:
+    """Return the first ``limit`` chars of the indented JSON trace.
+
+    Lists are capped before encoding instead of encoding everything and
+    slicing. With indent=2 every list element costs at least 6 chars
+    ("\\n    x,"), so elements past limit // 6 can never appear in the
+    output and the result is identical to dumping the full trace.
+    """
+    cap = limit // 6 + 1
+    capped = {k: (v[:cap] if isinstance(v, list) else v) for k, v in trace.items()}
+    return json.dumps(capped, ensure_ascii=False, indent=2)[:limit]
+
+
 # -------------------------
 # Public tool
 # -------------------------
@@ -975,15 +992,22 @@ def graph_rag_search(
 
     merged.sort(key=lambda x: (0 if x.source == "vector" else 1, -x.score))
 
-    out: list[str] = []
-    out.append(_("out.query", default="Search Query: {query}").format(query=query))
-    out.append(
+    buf = io.StringIO()
+
+    def emit(line: str) -> None:
+        # Same layout as "\n".join(lines): separator before every line but the first.
+        if buf.tell():
+            buf.write("\n")
+        buf.write(line)
+
+    emit(_("out.query", default="Search Query: {query}").format(query=query))
+    emit(
         _("out.target_dir", default="Target Directory: {root_path}").format(
             root_path=root_path
         )
     )
-    out.append(_("out.db", default="DB: {db_path}").format(db_path=db_path))
-    out.append(
+    emit(_("out.db", default="DB: {db_path}").format(db_path=db_path))
+    emit(
         _(
             "out.hits_summary",
             default="vector_hits: {v} / graph_hits: {g} / merged: {m}",
@@ -998,36 +1022,37 @@ def graph_rag_search(
                 continue
             s.add(w)
             uniq_w.append(w)
-        out.append(
+        emit(
             _(
                 "warn.indexing_title",
                 default="\n[WARN] Indexing warnings (de-duplicated, top 50):",
             )
         )
         for w in uniq_w[:50]:
-            out.append(f"- {w}")
+            emit(f"- {w}")
 
-    out.append("\n[Graph trace] (ids only, summary)")
-    out.append(json.dumps(trace, ensure_ascii=False, indent=2)[:4000])
+    emit("\n[Graph trace] (ids only, summary)")
+    emit(_dump_trace(trace))
 
-    out.append(_("out.results_title", default="\n[Results]"))
+    emit(_("out.results_title", default="\n[Results]"))
     for rank, h in enumerate(merged, 1):
         fpath = id_to_path.get(h.file_id, "unknown")
         rel_path = os.path.relpath(fpath, root_abs) if fpath != "unknown" else "unknown"
-        snippet = h.text.replace("\n", " ")[:240] + ("..." if len(h.text) > 240 else "")
-        out.append(
+        # Slice before replace: "\n" -> " " is 1:1, so only 240 chars are copied.
+        snippet = h.text[:240].replace("\n", " ") + ("..." if len(h.text) > 240 else "")
+        emit(
             f"[{rank}] source={h.source} score={h.score:.4f} file={rel_path} (vector_id={h.vector_id})"
         )
-        out.append(
+        emit(
             _("out.result_content", default="Content: {snippet}\n").format(
                 snippet=snippet
             )
         )
 
     if not merged:
-        out.append(_("out.no_docs", default="No relevant documents found."))
+        emit(_("out.no_docs", default="No relevant documents found."))
 
-    return "\n".join(out)
+    return buf.getvalue()
 
 
 def run_tool(args: dict[str, Any]) -> str:
@@ -5,13 +5,14 @@ _ = make_tool_translator(__file__)
 
 
 import json
-import asyncio
 import sys
 import os
 from ..env_utils import env_get
 from typing import Any
 
 from .mcp.client import MCPClient
+from .mcp_pool import call_pooled, items_key, run_coro
+from .mcp_servers_shared import load_servers_by_name
 
 try:
     from .mcp_servers_shared import get_default_mcp_config_path
@@ -59,6 +60,23 @@ def mask_values(data: Any) -> Any:
         return "*"
 
 
+def _masked_args_for_log(argv: dict[str, Any]) -> dict[str, Any]:
+    """Masked view of argv for the stderr call log.
+
+    Only top-level keys are shown by default so large payloads (base64 blobs,
+    nested documents) are not walked on every call. Set UAGENT_DEBUG_TOOLS=1
+    to log the fully masked structure.
+    """
+    if str(env_get("UAGENT_DEBUG_TOOLS", "")).strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }:
+        return mask_values(argv)
+    return dict.fromkeys(argv, "*")
+
+
 TOOL_SPEC: dict[str, Any] = {
     "type": "function",
     "x_parallel_safe": True,
@@ -143,15 +161,19 @@ async def _call_mcp_stdio(
     argv: dict[str, Any],
     protocol_mode: str = "auto",
 ) -> str:
+    key = ("stdio", command, tuple(args), items_key(env), protocol_mode)
     try:
-        async with MCPClient(
-            command=command,
-            args=args,
-            env=env,
-            protocol_mode=protocol_mode,
-        ) as client:
-            result = await client.call_tool(name, argv)
-            return _format_result(result)
+        result = await call_pooled(
+            key,
+            lambda: MCPClient(
+                command=command,
+                args=args,
+                env=env,
+                protocol_mode=protocol_mode,
+            ),
+            lambda client: client.call_tool(name, argv),
+        )
+        return _format_result(result)
     except Exception as exc:
         return f"[Error] MCP stdio call failed: {exc}"
 
@@ -190,14 +212,18 @@ async def _call_mcp_http(
     headers: dict[str, str] | None = None,
     protocol_mode: str = "auto",
 ) -> str:
+    key = ("http", url, items_key(headers), protocol_mode)
     try:
-        async with MCPClient(
-            url=url,
-            headers=headers or {},
-            protocol_mode=protocol_mode,
-        ) as client:
-            result = await client.call_tool(name, argv)
-            return _format_result(result)
+        result = await call_pooled(
+            key,
+            lambda: MCPClient(
+                url=url,
+                headers=headers or {},
+                protocol_mode=protocol_mode,
+            ),
+            lambda client: client.call_tool(name, argv),
+        )
+        return _format_result(result)
     except Exception as exc:
         return f"[Error] MCP http call failed: {exc}"
 
@@ -396,7 +422,7 @@ def run_tool(args: dict[str, Any]) -> str:
     if not name:
         return _("err.tool_name_required", default="Error: tool_name is required.")
 
-    masked_argv = mask_values(argv)
+    masked_argv = _masked_args_for_log(argv)
     print(f"[MCP Call] Tool: {name}", file=sys.stderr)
     print(f"[MCP Args] {json.dumps(masked_argv, ensure_ascii=False)}", file=sys.stderr)
 
@@ -409,24 +435,18 @@ def run_tool(args: dict[str, Any]) -> str:
     if server_name:
         if config_path and os.path.exists(config_path):
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    servers = config.get("mcp_servers", [])
-                    found = False
-                    for s in servers:
-                        if s.get("name") == server_name:
-                            url = s.get("url", "")
-                            command = s.get("command", "")
-                            cmd_args = s.get("args", [])
-                            cmd_env = s.get("env", {})
-                            http_headers = _resolve_http_headers(s.get("headers"))
-                            configured_mode = str(s.get("protocol_mode") or "").strip().lower()
-                            if configured_mode in {"auto", "legacy", "stateless"}:
-                                protocol_mode = configured_mode
-                            found = True
-                            break
-                    if not found and not url:
-                        return f"Error: Server with name '{server_name}' not found in {config_path}"
+                s = load_servers_by_name(config_path).get(server_name)
+                if s is not None:
+                    url = s.get("url", "")
+                    command = s.get("command", "")
+                    cmd_args = s.get("args", [])
+                    cmd_env = s.get("env", {})
+                    http_headers = _resolve_http_headers(s.get("headers"))
+                    configured_mode = str(s.get("protocol_mode") or "").strip().lower()
+                    if configured_mode in {"auto", "legacy", "stateless"}:
+                        protocol_mode = configured_mode
+                elif not url:
+                    return f"Error: Server with name '{server_name}' not found in {config_path}"
             except Exception as e:
                 return f"Error loading MCP config: {e}"
 
@@ -441,7 +461,7 @@ def run_tool(args: dict[str, Any]) -> str:
 
     try:
         if command:
-            result_text = asyncio.run(
+            result_text = run_coro(
                 _call_mcp_stdio(
                     command, cmd_args, cmd_env, name, argv, protocol_mode
                 )
@@ -450,13 +470,13 @@ def run_tool(args: dict[str, Any]) -> str:
             parts = url[8:].strip().split()
             if not parts:
                 return _("err.stdio_url_invalid", default="Error: Invalid stdio url")
-            result_text = asyncio.run(
+            result_text = run_coro(
                 _call_mcp_stdio(
                     parts[0], parts[1:], {}, name, argv, protocol_mode
                 )
             )
         else:
-            result_text = asyncio.run(_call_mcp_http(
+            result_text = run_coro(_call_mcp_http(
                 url, name, argv, http_headers, protocol_mode
             ))
         trunc = getattr(cb, "truncate_output", None)
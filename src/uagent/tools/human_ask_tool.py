@@ -4,7 +4,9 @@ from __future__ import annotations
 from typing import Any
 import json
 import queue
+import re
 import threading
+import time
 
 from .context import get_callbacks
 from .i18n_helper import make_tool_translator
@@ -69,6 +71,63 @@ TOOL_SPEC: dict[str, Any] = {
 }
 
 
+class _ReplySlot:
+    """Single-reply handoff from stdin_loop/GUI to the waiting human_ask.
+
+    Duck-types the ``put``/``get`` subset of ``queue.Queue`` that hosts use on
+    ``core.human_ask_queue``, but is backed by one Event and one slot. Only one
+    human_ask is active at a time (human_ask_lock), so a single module-level
+    instance is reset and reused instead of allocating a queue per call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._value: str | None = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = None
+            self._event.clear()
+
+    def put(self, item: str, block: bool = True, timeout: float | None = None) -> None:
+        # First reply wins, matching FIFO order for a single get().
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._value = item
+            self._event.set()
+
+    put_nowait = put
+
+    def get(self, block: bool = True, timeout: float | None = None) -> str:
+        if not block:
+            timeout = 0.0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Wait in short slices so Ctrl+C / shutdown is not blocked indefinitely.
+            remaining = None if deadline is None else deadline - time.monotonic()
+            step = 0.5 if remaining is None else max(0.0, min(0.5, remaining))
+            if self._event.wait(step):
+                with self._lock:
+                    value = self._value
+                    self._value = None
+                    self._event.clear()
+                return value or ""
+            if remaining is not None and remaining <= 0.5:
+                raise queue.Empty
+
+
+_REPLY_SLOT = _ReplySlot()
+
+# CRLF / CR / LF in one pass (instead of normalizing twice and then splitting).
+_LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+
+def _split_keep_lines(s: str) -> list[str]:
+    return _LINE_BREAK_RE.split(str(s))
+
+
 def run_tool(args: dict[str, Any]) -> str:
     """human_ask does not read from stdin directly.
 
@@ -172,9 +231,6 @@ def run_tool(args: dict[str, Any]) -> str:
             default="[human_ask error] human_ask_set_password callback is not initialized.",
         )
 
-    # Queue dedicated to this human_ask call
-    local_q: "queue.Queue[str]" = queue.Queue()
-
     with cb.human_ask_lock:
         if cb.human_ask_active_ref():
             return _(
@@ -184,7 +240,8 @@ def run_tool(args: dict[str, Any]) -> str:
 
         cb.human_ask_set_active(True)
         cb.human_ask_set_password(is_password)
-        cb.human_ask_set_queue(local_q)
+        _REPLY_SLOT.reset()
+        cb.human_ask_set_queue(_REPLY_SLOT)
 
         lines = cb.human_ask_lines_ref()
         try:
@@ -220,8 +277,8 @@ def run_tool(args: dict[str, Any]) -> str:
         )
         keepalive_thread.start()
         try:
-            # stdin_loop/GUI sends the user input to local_q
-            user_reply = local_q.get() or ""
+            # stdin_loop/GUI sends the user input via core.human_ask_queue
+            user_reply = _REPLY_SLOT.get()
         finally:
             stop_keepalive.set()
             try:
@@ -237,11 +294,6 @@ def run_tool(args: dict[str, Any]) -> str:
             except Exception:
                 pass
 
-        def _split_keep_lines(s: str) -> list[str]:
-            # normalize CRLF/CR to LF
-            s2 = str(s).replace("\r\n", "\n").replace("\r", "\n")
-            return s2.split("\n")
-
         reply_lines = _split_keep_lines(user_reply) if user_reply else []
 
         # ---------------------------------------------------------
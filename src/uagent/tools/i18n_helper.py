@@ -158,8 +158,22 @@ def _load_tool_dict(json_path: str) -> dict[str, Any]:
         return {}
 
 
+# Bumped by clear_tool_i18n_cache() so translators drop their bound maps.
+_cache_generation = 0
+
+# Env vars consulted by detect_lang(); translators rebind only when these change.
+_LOCALE_ENV_KEYS = ("UAGENT_LANG", "LC_ALL", "LANG")
+
+
+def _locale_env_snapshot() -> tuple[Optional[str], ...]:
+    environ = os.environ
+    return tuple(environ.get(k) for k in _LOCALE_ENV_KEYS)
+
+
 def clear_tool_i18n_cache() -> None:
     """Clear cached tool translation JSON data."""
+    global _cache_generation
+    _cache_generation += 1
     try:
         _load_tool_dict.cache_clear()
     except Exception:
@@ -181,23 +195,34 @@ def make_tool_translator(tool_py_file: str):
     base = os.path.splitext(os.path.basename(tool_py_file))[0]
     json_path = os.path.join(tool_dir, f"{base}.json")
 
+    # Locale + per-locale maps are resolved once and reused until the locale
+    # env vars change or the tool cache is cleared.
+    bound: dict[str, Any] = {"env": None, "gen": -1, "loc": {}, "en": {}}
+
+    def _bind() -> tuple[dict[str, Any], dict[str, Any]]:
+        env = _locale_env_snapshot()
+        if bound["env"] != env or bound["gen"] != _cache_generation:
+            data = _load_tool_dict(json_path)
+            loc_map = data.get(get_locale())
+            en_map = data.get("en")
+            bound["loc"] = loc_map if isinstance(loc_map, dict) else {}
+            bound["en"] = en_map if isinstance(en_map, dict) else {}
+            bound["env"] = env
+            bound["gen"] = _cache_generation
+        return bound["loc"], bound["en"]
+
     def _(key: str, *, default: Any, **kwargs: object) -> Any:
-        loc = get_locale()
-        data = _load_tool_dict(json_path)
+        loc_map, en_map = _bind()
 
         text = None
-        loc_map = data.get(loc)
-        if isinstance(loc_map, dict):
-            v = loc_map.get(key)
-            if isinstance(v, (str, list, dict)) and v:
-                text = _unescape_value(v)
+        v = loc_map.get(key)
+        if isinstance(v, (str, list, dict)) and v:
+            text = _unescape_value(v)
 
         if text is None:
-            en_map = data.get("en")
-            if isinstance(en_map, dict):
-                v = en_map.get(key)
-                if isinstance(v, (str, list, dict)) and v:
-                    text = _unescape_value(v)
+            v = en_map.get(key)
+            if isinstance(v, (str, list, dict)) and v:
+                text = _unescape_value(v)
 
         if text is None:
             text = default
@@ -6,6 +6,8 @@ _ = make_tool_translator(__file__)
 
 import os
 import glob
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from ..env_utils import env_get
@@ -101,6 +103,79 @@ else:
     }
 
 
+def _index_workers() -> int:
+    try:
+        return int(env_get("UAGENT_INDEX_WORKERS", "8") or "8")
+    except ValueError:
+        return 8
+
+
+def _split_pattern(pattern: str) -> list[str]:
+    return [p for p in pattern.replace("\\", "/").split("/") if p not in ("", ".")]
+
+
+def _has_magic(segment: str) -> bool:
+    return any(c in segment for c in "*?[")
+
+
+def _match_segments(pat: list[str], parts: list[str]) -> bool:
+    """Match path parts against pattern segments (``**`` = zero or more parts)."""
+    if not pat:
+        return not parts
+    head = pat[0]
+    if head == "**":
+        return any(_match_segments(pat[1:], parts[i:]) for i in range(len(parts) + 1))
+    return (
+        bool(parts)
+        and fnmatch.fnmatch(parts[0], head)
+        and _match_segments(pat[1:], parts[1:])
+    )
+
+
+def _walk_recursive_pattern(root_abs: str, pattern: str) -> list[str] | None:
+    """Expand a recursive ``**`` pattern with a pruned os.walk.
+
+    glob.glob() descends into .git / node_modules / .venv and leaves the
+    filtering to is_ignored_path afterwards. Here ignored directories are
+    dropped from ``dirnames`` so they are never traversed, and walked entries
+    only need the per-name check because their parents were already checked.
+
+    Returns None when the pattern is not handled here (caller uses glob).
+    """
+    if os.path.isabs(pattern):
+        return None
+    segments = _split_pattern(pattern)
+    if ".." in segments or "**" not in segments:
+        return None
+
+    from uagent.utils.scan_filters import is_ignored_path
+
+    if is_ignored_path(root_abs):
+        return []
+
+    # Start walking below the literal (non-magic) prefix of the pattern.
+    prefix: list[str] = []
+    while segments and not _has_magic(segments[0]):
+        prefix.append(segments.pop(0))
+    if any(is_ignored_path(p) for p in prefix):
+        return []
+    base = os.path.join(root_abs, *prefix)
+    if not os.path.isdir(base):
+        return []
+
+    out: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames[:] = [d for d in dirnames if not is_ignored_path(d)]
+        rel = os.path.relpath(dirpath, base)
+        rel_parts = [] if rel == os.curdir else rel.split(os.sep)
+        for name in filenames:
+            if is_ignored_path(name):
+                continue
+            if _match_segments(segments, rel_parts + [name]):
+                out.append(os.path.join(dirpath, name))
+    return out
+
+
 def run_tool(args: dict[str, Any]) -> str:
     if sync_file is None:
         return _(
@@ -124,8 +199,15 @@ def run_tool(args: dict[str, Any]) -> str:
 
     search_pattern = os.path.join(root_abs, pattern)
 
+    walked: list[str] | None = None
     try:
-        files = glob.glob(search_pattern, recursive=recursive)
+        if recursive:
+            walked = _walk_recursive_pattern(root_abs, pattern)
+        files = (
+            walked
+            if walked is not None
+            else glob.glob(search_pattern, recursive=recursive)
+        )
     except Exception as e:
         return _(
             "err.glob_fail", default="Error: Failed to parse pattern: {err}"
@@ -149,10 +231,13 @@ def run_tool(args: dict[str, Any]) -> str:
         except Exception:
             return True
 
+    # Walked results were already filtered against the ignore rules.
     target_files = [
         f
         for f in files
-        if os.path.isfile(f) and (not is_ignored_path(f)) and (not _is_binary_file(f))
+        if os.path.isfile(f)
+        and (walked is not None or not is_ignored_path(f))
+        and (not _is_binary_file(f))
     ]
 
     if not target_files:
@@ -166,14 +251,22 @@ def run_tool(args: dict[str, Any]) -> str:
     error_details = []
     total_count = len(target_files)
 
-    for idx, fpath in enumerate(target_files, start=1):
-        print(f"[index_files] {idx}/{total_count}: {fpath}")
-        try:
-            sync_file(fpath, root_abs)
-            success_count += 1
-        except Exception as e:
-            error_count += 1
-            error_details.append(f"{fpath}: {e}")
+    # sync_file is dominated by embedding API calls (network-bound) and only
+    # holds the DB lock for its reads/writes, so index files concurrently.
+    max_workers = max(1, min(_index_workers(), total_count))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="index_files"
+    ) as executor:
+        fut_map = {executor.submit(sync_file, f, root_abs): f for f in target_files}
+        for idx, fut in enumerate(as_completed(fut_map), start=1):
+            fpath = fut_map[fut]
+            print(f"[index_files] {idx}/{total_count}: {fpath}")
+            try:
+                fut.result()
+                success_count += 1
+            except Exception as e:
+                error_count += 1
+                error_details.append(f"{fpath}: {e}")
 
     result = [
         _("out.completed", default="Indexing process completed."),
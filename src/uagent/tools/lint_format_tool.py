@@ -20,11 +20,14 @@ from .i18n_helper import make_tool_translator
 _ = make_tool_translator(__file__)
 
 
+import importlib.util
 import json
 import os
-import re
 import shlex
+import shutil
 import subprocess
+import sys
+import time
 from pathlib import Path
 from typing import Any, Optional
 
@@ -125,11 +128,12 @@ TOOL_SPEC: dict[str, Any] = {
 }
 
 
-_META_RE = re.compile(r"(&&|\|\||[&|;!<>`$])")
+# Any of these characters (which also covers `&&` and `||`) is rejected.
+_META_CHARS = frozenset("&|;!<>`$")
 
 
 def _reject_if_meta(s: str) -> Optional[str]:
-    if _META_RE.search(s or ""):
+    if not _META_CHARS.isdisjoint(s or ""):
         return f"shell metacharacters are not allowed in arguments: {s!r}"
     return None
 
@@ -148,18 +152,20 @@ def _truncate(label: str, text: str) -> str:
 
 
 def _quote_cmd_parts(parts: list[str]) -> str:
+    """Render argv as a command line for display in results."""
     if os.name == "nt":
         return subprocess.list2cmdline([str(p) for p in parts])
     return " ".join(shlex.quote(str(p)) for p in parts)
 
 
 def _cmd_exec_json(
-    command: str, cwd: Optional[str]
+    argv: list[str], cwd: Optional[str]
 ) -> tuple[str, str, int, Optional[str]]:
     try:
-        from .cmd_exec_json_tool import run_tool as cmd_exec_json
+        from .cmd_exec_json_tool import run_argv
 
-        out = cmd_exec_json({"command": command, "cwd": cwd})
+        # argv goes straight to the process; no shell quoting and re-parsing.
+        out = run_argv(argv, cwd=cwd)
         obj = json.loads(out)
         if obj.get("blocked"):
             return "", "", 1, str(obj.get("reason") or "blocked")
@@ -178,22 +184,126 @@ def _cmd_exec_json(
         )
 
 
+# Tool availability probes: module -> (checked_at, available).
+# Each miss used to spawn `python -m <tool> --version`; results are reused
+# for _TOOL_PROBE_TTL_S seconds.
+_TOOL_PROBE_TTL_S = 300.0
+_TOOL_EXISTS_CACHE: dict[str, tuple[float, bool]] = {}
+_TOOL_ARGV_CACHE: dict[str, list[str]] = {}
+_SAME_PYTHON: Optional[bool] = None
+
+
+def _path_python_is_current() -> bool:
+    """Return True if `python` on PATH is this interpreter.
+
+    Only then does an in-process find_spec() answer for `python -m <tool>`.
+    """
+    global _SAME_PYTHON
+    if _SAME_PYTHON is None:
+        try:
+            found = shutil.which("python")
+            _SAME_PYTHON = bool(found) and os.path.samefile(found, sys.executable)
+        except Exception:
+            _SAME_PYTHON = False
+    return _SAME_PYTHON
+
+
+def _probe_cached(module: str, argv: list[str]) -> bool:
+    now = time.monotonic()
+    hit = _TOOL_EXISTS_CACHE.get(module)
+    if hit is not None and now - hit[0] < _TOOL_PROBE_TTL_S:
+        return hit[1]
+
+    if shutil.which(module):
+        exists = True
+    elif _path_python_is_current():
+        try:
+            exists = importlib.util.find_spec(module) is not None
+        except Exception:
+            exists = False
+    else:
+        so, se, code, _ = _cmd_exec_json(argv, cwd=None)
+        exists = code == 0
+
+    _TOOL_EXISTS_CACHE[module] = (now, exists)
+    return exists
+
+
+_PROBE_SCRIPT = (
+    "import importlib.util, json, sys; "
+    "print(json.dumps({m: importlib.util.find_spec(m) is not None "
+    "for m in sys.argv[1:]}))"
+)
+
+
+def _prefetch_tool_probes(modules: tuple[str, ...]) -> None:
+    """Probe all uncached `modules` with a single PATH-python subprocess.
+
+    Only needed when `python` on PATH is another interpreter; otherwise the
+    per-module probe is an in-process find_spec() anyway.
+    """
+    if _path_python_is_current():
+        return
+    now = time.monotonic()
+    pending = []
+    for module in modules:
+        hit = _TOOL_EXISTS_CACHE.get(module)
+        if hit is not None and now - hit[0] < _TOOL_PROBE_TTL_S:
+            continue
+        if shutil.which(module):
+            continue
+        pending.append(module)
+    if not pending:
+        return
+
+    so, se, code, _ = _cmd_exec_json(
+        ["python", "-c", _PROBE_SCRIPT, *pending], cwd=None
+    )
+    if code != 0:
+        return
+    try:
+        found = json.loads(so.strip().splitlines()[-1])
+    except Exception:
+        return
+    if not isinstance(found, dict):
+        return
+    for module in pending:
+        _TOOL_EXISTS_CACHE[module] = (now, bool(found.get(module)))
+
+
+def _tool_argv(tool: str) -> list[str]:
+    """Return the argv prefix that launches `tool`.
+
+    A standalone executable on PATH (ruff is a native binary) is used as-is
+    to skip a Python interpreter start; otherwise fall back to
+    `python -m <tool>`.
+    """
+    argv = _TOOL_ARGV_CACHE.get(tool)
+    if argv is None:
+        found = shutil.which(tool)
+        argv = [found] if found else ["python", "-m", tool]
+        _TOOL_ARGV_CACHE[tool] = argv
+    return list(argv)
+
+
 def _tool_exists_py(module: str) -> bool:
-    """Return True if `python -m <module> --version` succeeds."""
-    so, se, code, _ = _cmd_exec_json(f"python -m {module} --version", cwd=None)
-    return code == 0
+    """Return True if `module` is on PATH or `python -m <module>` works."""
+    return _probe_cached(module, ["python", "-m", module, "--version"])
 
 
 def _tool_exists_mdformat() -> bool:
     """mdformat doesn't have a stable `--version`; use `--help` to detect."""
-    so, se, code, _ = _cmd_exec_json("python -m mdformat --help", cwd=None)
-    return code == 0
+    return _probe_cached("mdformat", ["python", "-m", "mdformat", "--help"])
 
 
 def _pip_install(package: str) -> bool:
     so, se, code, _ = _cmd_exec_json(
-        f"python -m pip install --disable-pip-version-check {package}", cwd=None
+        ["python", "-m", "pip", "install", "--disable-pip-version-check", package],
+        cwd=None,
     )
+    _TOOL_EXISTS_CACHE.pop(package, None)
+    _TOOL_ARGV_CACHE.pop(package, None)
+    importlib.invalidate_caches()
     return code == 0
 
 
@@ -213,6 +323,14 @@ def _ensure_mdformat_tool(auto_install: bool) -> bool:
     return _pip_install("mdformat") and _tool_exists_mdformat()
 
 
+# Arguments placed between the launcher (see _tool_argv) and the targets.
+_TOOL_MODE_ARGS: dict[str, dict[str, list[str]]] = {
+    "ruff": {"check": ["check"], "fix": ["check", "--fix"]},
+    "black": {"check": ["--check"], "fix": []},
+    "mypy": {"check": [], "fix": []},
+    "mdformat": {"check": ["--check"], "fix": []},
+}
+
 _TOOL_SUFFIXES: dict[str, set[str]] = {
     "ruff": {".py"},
     "black": {".py"},
@@ -324,6 +442,7 @@ def run_tool(args: dict[str, Any]) -> str:
     if tools:
         selected = [str(x) for x in tools]
     else:
+        _prefetch_tool_probes(("ruff", "black", "mypy", "mdformat"))
         if _tool_exists_py("ruff"):
             selected.append("ruff")
         if _tool_exists_py("black"):
@@ -359,75 +478,49 @@ def run_tool(args: dict[str, Any]) -> str:
                 {"ok": False, "error": "cancelled by user"}, ensure_ascii=False
             )
 
-    overall_ok = True
-    results: list[dict[str, Any]] = []
+    # (tool, argv); argv is None for unsupported tools.
+    planned: list[tuple[str, Optional[list[str]]]] = []
 
     for tool in selected:
-        tool_safe_targets = safe_targets
-
-        if tool == "ruff":
-            if mode == "check":
-                cmd_parts = (
-                    ["python", "-m", "ruff", "check"]
-                    + tool_safe_targets
-                    + sanitized_extra
-                )
-            else:
-                cmd_parts = (
-                    ["python", "-m", "ruff", "check", "--fix"]
-                    + tool_safe_targets
-                    + sanitized_extra
-                )
-        elif tool == "black":
-            if mode == "check":
-                cmd_parts = (
-                    ["python", "-m", "black", "--check"]
-                    + tool_safe_targets
-                    + sanitized_extra
-                )
-            else:
-                cmd_parts = (
-                    ["python", "-m", "black"] + tool_safe_targets + sanitized_extra
-                )
-        elif tool == "mypy":
-            cmd_parts = ["python", "-m", "mypy"] + tool_safe_targets + sanitized_extra
-        elif tool == "mdformat":
-            if mode == "check":
-                cmd_parts = (
-                    ["python", "-m", "mdformat", "--check"]
-                    + tool_safe_targets
-                    + sanitized_extra
-                )
-            else:
-                cmd_parts = (
-                    ["python", "-m", "mdformat"] + tool_safe_targets + sanitized_extra
-                )
-        else:
-            results.append({"tool": tool, "ok": False, "error": "unsupported tool"})
-            overall_ok = False
+        mode_args = _TOOL_MODE_ARGS.get(tool)
+        if mode_args is None:
+            planned.append((tool, None))
             continue
 
-        cmd_str = _quote_cmd_parts(cmd_parts)
-        so, se, code, err_tag = _cmd_exec_json(cmd_str, cwd=run_cwd)
-        so_t = _truncate(f"{tool} stdout", so)
-        se_t = _truncate(f"{tool} stderr", se)
+        cmd_parts = _tool_argv(tool) + mode_args[mode] + safe_targets + sanitized_extra
+        planned.append((tool, cmd_parts))
 
-        ok = code == 0
-        if not ok:
-            overall_ok = False
+    def _run_one(tool: str, cmd_parts: Optional[list[str]]) -> dict[str, Any]:
+        if cmd_parts is None:
+            return {"tool": tool, "ok": False, "error": "unsupported tool"}
 
+        cmd_str = _quote_cmd_parts(cmd_parts)
+        so, se, code, err_tag = _cmd_exec_json(cmd_parts, cwd=run_cwd)
         r: dict[str, Any] = {
             "tool": tool,
             "command": cmd_str,
             "cwd": run_cwd,
             "returncode": code,
-            "ok": ok,
-            "stdout": so_t,
-            "stderr": se_t,
+            "ok": code == 0,
+            "stdout": _truncate(f"{tool} stdout", so),
+            "stderr": _truncate(f"{tool} stderr", se),
         }
         if err_tag:
             r["error_tag"] = err_tag
-        results.append(r)
+        return r
+
+    # check mode is read-only, so the tools can run side by side. fix mode
+    # stays sequential: ruff --fix and black must not rewrite the same file
+    # at the same time.
+    if mode == "check" and len(planned) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(planned)) as ex:
+            results = list(ex.map(lambda p: _run_one(*p), planned))
+    else:
+        results = [_run_one(*p) for p in planned]
+
+    overall_ok = all(r.get("ok") for r in results)
 
     return json.dumps(
         {"ok": overall_ok, "mode": mode, "results": results}, ensure_ascii=False
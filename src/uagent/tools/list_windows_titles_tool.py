@@ -73,6 +73,12 @@ TOOL_SPEC: dict[str, Any] = {
     },
 }
 
+# ctypes (Windows), the Linux helpers and Quartz (macOS) are imported only
+# when run_tool dispatches to them; other platforms have no backend.
+if not (sys.platform in ("win32", "darwin") or sys.platform.startswith("linux")):
+    LOAD_DISABLED_REASON = f"Unsupported platform: {sys.platform}"
+    TOOL_SPEC["tool_level"] = -1
+
 
 BUSY_LABEL = False
 
@@ -113,6 +119,13 @@ def _list_windows_win32(
 
     windows = []
 
+    # Shared across callbacks; a larger title buffer is only allocated for
+    # the rare title that does not fit. The PID is read in the same pass.
+    title_buf = ctypes.create_unicode_buffer(512)
+    class_buf = ctypes.create_unicode_buffer(256)
+    pid_out = wintypes.DWORD(0)
+    pid_ref = ctypes.byref(pid_out)
+
     @EnumWindowsProc
     def enum_proc(hwnd, lParam):
         try:
@@ -122,18 +135,19 @@ def _list_windows_win32(
             length = GetWindowTextLengthW(hwnd)
             title = ""
             if length > 0:
-                buf = ctypes.create_unicode_buffer(length + 1)
+                buf = title_buf
+                if length + 1 > len(buf):
+                    buf = ctypes.create_unicode_buffer(length + 1)
                 GetWindowTextW(hwnd, buf, length + 1)
                 title = buf.value
             info = {"hwnd": int(hwnd), "title": title, "visible": visible}
             if include_class:
-                buf = ctypes.create_unicode_buffer(256)
-                GetClassNameW(hwnd, buf, 256)
-                info["class"] = buf.value
+                GetClassNameW(hwnd, class_buf, len(class_buf))
+                info["class"] = class_buf.value
             if include_pid:
-                pid = wintypes.DWORD(0)
-                GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-                info["pid"] = int(pid.value)
+                pid_out.value = 0
+                GetWindowThreadProcessId(hwnd, pid_ref)
+                info["pid"] = int(pid_out.value)
             windows.append(info)
         except Exception:
             pass
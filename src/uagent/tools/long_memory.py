@@ -5,14 +5,32 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 from ..env_utils import env_get
 import time
-from typing import Any
+from typing import Any, Optional
 
+from ..utils.json_codec import json_loads
 from .i18n_helper import make_tool_translator
 
 _ = make_tool_translator(__file__)
 
+# Deletions are recorded in a sidecar "<memory file>.deleted" as
+# "<line number> <record hash>" lines instead of rewriting the JSONL. The
+# file is compacted once tombstones exceed _COMPACT_RATIO of its records.
+_TOMBSTONE_SUFFIX = ".deleted"
+_COMPACT_RATIO = 0.1
+
+# Directories already created (or found) by _ensure_dir.
+_KNOWN_DIRS: set[str] = set()
+
+# path -> (stamps, records, line numbers) of the last parse; stamps are
+# (st_mtime_ns, st_size) of the JSONL and its tombstone sidecar.
+_RECORDS_CACHE: dict[
+    str,
+    tuple[tuple[Any, Any], list[dict[str, Any]], list[int]],
+] = {}
+
 
 def _get_base_log_dir() -> str:
     from uagent.utils.paths import get_log_dir
@@ -20,6 +38,14 @@ def _get_base_log_dir() -> str:
     return str(get_log_dir())
 
 
+def _ensure_dir(dirpath: str) -> None:
+    """os.makedirs once per directory per process (append is a hot path)."""
+    if not dirpath or dirpath in _KNOWN_DIRS:
+        return
+    os.makedirs(dirpath, exist_ok=True)
+    _KNOWN_DIRS.add(dirpath)
+
+
 def get_memory_file_path() -> str:
     """Return the resolved path to the personal long-memory JSONL file."""
     base_log_dir = _get_base_log_dir()
@@ -36,24 +62,44 @@ def append_long_memory(note: str) -> None:
     """Append one memory record to the JSONL file. Errors are ignored."""
     memory_file = get_memory_file_path()
     try:
-        dirpath = os.path.dirname(memory_file)
-        if dirpath:
-            os.makedirs(dirpath, exist_ok=True)
+        _ensure_dir(os.path.dirname(memory_file))
         record = {"ts": time.time(), "note": note}
         with open(memory_file, "a", encoding="utf-8") as f:
             f.write(json.dumps(record, ensure_ascii=False) + "\n")
     except Exception:
-        pass
+        # The directory may have been removed; recreate it next time.
+        _KNOWN_DIRS.discard(os.path.dirname(memory_file))
+    _RECORDS_CACHE.pop(memory_file, None)
 
 
 def load_long_memory_raw() -> str:
-    """Load the JSONL content as raw text (truncated)."""
+    """Load the JSONL content as raw text (truncated).
+
+    When the file exceeds the limit, only its tail (the most recent records,
+    starting at a line boundary) is read.
+    """
     memory_file = get_memory_file_path()
     max_bytes = get_max_memory_bytes()
 
     try:
-        with open(memory_file, encoding="utf-8") as f:
-            data = f.read(max_bytes + 1)
+        if os.path.exists(memory_file + _TOMBSTONE_SUFFIX):
+            # Deleted records are still in the file; render the live ones.
+            if not os.path.exists(memory_file):
+                raise FileNotFoundError(memory_file)
+            records, _positions = _load_entries(memory_file)
+            raw = "".join(
+                json.dumps(rec, ensure_ascii=False) + "\n" for rec in records
+            ).encode("utf-8")
+            truncated = len(raw) > max_bytes
+            if truncated:
+                raw = raw[-max_bytes:]
+        else:
+            with open(memory_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                truncated = size > max_bytes
+                if truncated:
+                    f.seek(size - max_bytes)
+                raw = f.read(max_bytes)
     except FileNotFoundError:
         return _("msg.no_memory", default="(no long-term memory yet)")
     except Exception as e:
@@ -61,38 +107,135 @@ def load_long_memory_raw() -> str:
             err_type=type(e).__name__, err=str(e)
         )
 
-    truncated_note = ""
-    if len(data) > max_bytes:
-        data = data[:max_bytes]
-        truncated_note = _(
-            "msg.truncated",
-            default="\n[long_memory truncated: limited to {max_bytes} chars]",
-        ).format(max_bytes=max_bytes)
+    if not truncated:
+        return raw.decode("utf-8", errors="replace")
+
+    # Drop the partial record cut by the seek.
+    nl = raw.find(b"\n")
+    if nl != -1:
+        raw = raw[nl + 1 :]
+    data = raw.decode("utf-8", errors="replace")
+    truncated_note = _(
+        "msg.truncated",
+        default="\n[long_memory truncated: limited to {max_bytes} chars]",
+    ).format(max_bytes=max_bytes)
 
     return data + truncated_note
 
 
-def load_long_memory_records() -> list[dict[str, Any]]:
-    """Parse JSONL and return list of dicts. Broken lines are skipped."""
-    memory_file = get_memory_file_path()
-    records: list[dict[str, Any]] = []
+def _file_stamp(path: str) -> Optional[tuple[int, int]]:
     try:
-        with open(memory_file, encoding="utf-8") as f:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _record_hash(rec: dict[str, Any]) -> str:
+    import hashlib
+
+    data = json.dumps(rec, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _read_tombstones(memory_file: str) -> dict[int, str]:
+    tombstones: dict[int, str] = {}
+    try:
+        with open(memory_file + _TOMBSTONE_SUFFIX, encoding="utf-8") as f:
             for line in f:
+                pos, _sep, digest = line.strip().partition(" ")
+                if pos.isdigit() and digest:
+                    tombstones[int(pos)] = digest
+    except OSError:
+        pass
+    return tombstones
+
+
+def _load_entries(memory_file: str) -> tuple[list[dict[str, Any]], list[int]]:
+    """Return live records and their line numbers in the JSONL file."""
+    stamps = (_file_stamp(memory_file), _file_stamp(memory_file + _TOMBSTONE_SUFFIX))
+    if stamps[0] is None:
+        _RECORDS_CACHE.pop(memory_file, None)
+        return [], []
+
+    hit = _RECORDS_CACHE.get(memory_file)
+    if hit is not None and hit[0] == stamps:
+        return hit[1], hit[2]
+
+    tombstones = _read_tombstones(memory_file) if stamps[1] is not None else {}
+    records: list[dict[str, Any]] = []
+    positions: list[int] = []
+    try:
+        with open(memory_file, "rb") as f:
+            for pos, line in enumerate(f):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = json_loads(line)
                 except Exception:
                     continue
-                if isinstance(obj, dict) and "note" in obj:
-                    records.append(obj)
-    except FileNotFoundError:
-        pass
+                if not (isinstance(obj, dict) and "note" in obj):
+                    continue
+                # A tombstone only applies while the line still holds the
+                # record it was written for.
+                if pos in tombstones and tombstones[pos] == _record_hash(obj):
+                    continue
+                records.append(obj)
+                positions.append(pos)
     except Exception:
+        return records, positions
+
+    _RECORDS_CACHE[memory_file] = (stamps, records, positions)
+    return records, positions
+
+
+def load_long_memory_records() -> list[dict[str, Any]]:
+    """Parse JSONL and return list of dicts. Broken lines are skipped.
+
+    Tombstoned records are filtered out. The parse is cached until the
+    file or its tombstone sidecar changes.
+    """
+    records, _positions = _load_entries(get_memory_file_path())
+    return list(records)
+
+
+def _rewrite_records(memory_file: str, records: list[dict[str, Any]]) -> None:
+    """Rewrite the JSONL with `records` and drop the tombstone sidecar.
+
+    The new content is written to a temp file in the same directory and
+    swapped in with os.replace, so a crash never leaves a truncated file.
+    """
+    import tempfile
+
+    dirpath = os.path.dirname(memory_file) or "."
+    _ensure_dir(dirpath)
+    payload = "".join(
+        json.dumps(rec, ensure_ascii=False) + "\n" for rec in records
+    ).encode("utf-8")
+    tmp_fd, tmp_name = tempfile.mkstemp(
+        prefix=os.path.basename(memory_file) + ".", suffix=".tmp", dir=dirpath
+    )
+    try:
+        with os.fdopen(tmp_fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates the file 0600; keep the permissions of the file
+        # being replaced.
+        try:
+            shutil.copymode(memory_file, tmp_name)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, memory_file)
+    finally:
+        try:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+        except Exception:
+            pass
+    try:
+        os.remove(memory_file + _TOMBSTONE_SUFFIX)
+    except FileNotFoundError:
         pass
-    return records
 
 
 def update_long_memory_entry(index: int, note: str) -> bool:
@@ -103,31 +246,34 @@ def update_long_memory_entry(index: int, note: str) -> bool:
     memory_file = get_memory_file_path()
     try:
         records[index] = {"ts": time.time(), "note": note}
-        dirpath = os.path.dirname(memory_file)
-        if dirpath:
-            os.makedirs(dirpath, exist_ok=True)
-        with open(memory_file, "w", encoding="utf-8") as f:
-            for rec in records:
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        _rewrite_records(memory_file, records)
     except Exception:
         return False
+    finally:
+        _RECORDS_CACHE.pop(memory_file, None)
     return True
 
 
 def delete_long_memory_entry(index: int) -> bool:
-    """Delete one record by index. Returns True on success."""
-    records = load_long_memory_records()
+    """Delete one record by index. Returns True on success.
+
+    The deletion is appended to the tombstone sidecar; the JSONL is only
+    rewritten when enough tombstones have accumulated.
+    """
+    memory_file = get_memory_file_path()
+    records, positions = _load_entries(memory_file)
     if index < 0 or index >= len(records):
         return False
-    memory_file = get_memory_file_path()
     try:
-        records.pop(index)
-        dirpath = os.path.dirname(memory_file)
-        if dirpath:
-            os.makedirs(dirpath, exist_ok=True)
-        with open(memory_file, "w", encoding="utf-8") as f:
-            for rec in records:
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        tombstones = _read_tombstones(memory_file)
+        if len(tombstones) + 1 > _COMPACT_RATIO * (len(records) + len(tombstones)):
+            remaining = records[:index] + records[index + 1 :]
+            _rewrite_records(memory_file, remaining)
+        else:
+            with open(memory_file + _TOMBSTONE_SUFFIX, "a", encoding="utf-8") as f:
+                f.write(f"{positions[index]} {_record_hash(records[index])}\n")
     except Exception:
         return False
+    finally:
+        _RECORDS_CACHE.pop(memory_file, None)
     return True
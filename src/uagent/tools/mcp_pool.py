@@ -0,0 +1,228 @@
+"""Persistent event loop and pooled MCP client connections.
+
+Shared by handle_mcp_v2 and mcp_tools_list. Instead of asyncio.run() (a fresh
+loop, connection and session.initialize() per tool call), one daemon loop
+thread owns all MCP clients and keeps them connected between calls.
+
+MCPClient enters anyio task groups, which must be exited by the task that
+entered them, so each pooled client lives inside its own holder task and is
+closed by setting that task's stop event on the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import anyio
+
+from .mcp.client import MCPClient
+from .mcp.errors import MCPTransportError
+
+# Connected clients kept at most; the least recently used one is closed first.
+MAX_POOL_SIZE = 8
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+_ATEXIT_REGISTERED = False
+
+# key -> (client, stop event, holder task), least recently used first.
+# Only touched from the loop thread.
+_POOL: OrderedDict[tuple[Any, ...], tuple[MCPClient, asyncio.Event, asyncio.Task]] = (
+    OrderedDict()
+)
+_POOL_PENDING: dict[tuple[Any, ...], asyncio.Future] = {}
+# key -> number of call_pooled() calls currently using that client.
+_IN_USE: dict[tuple[Any, ...], int] = {}
+
+# MCPClient wraps every failure as MCPTransportError; these causes mean the
+# connection itself is gone (server restarted, killed stdio child) rather
+# than the request failing.
+_DEAD_CAUSES = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    EOFError,
+)
+# Subset raised by writing to an already closed stream: the request was
+# never sent, so it is safe to send it again on a new connection.
+_UNSENT_CAUSES = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP, _ATEXIT_REGISTERED
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+
+            def _runner() -> None:
+                asyncio.set_event_loop(loop)
+                loop.run_forever()
+
+            threading.Thread(target=_runner, name="mcp-pool-loop", daemon=True).start()
+            _LOOP = loop
+        if not _ATEXIT_REGISTERED:
+            _ATEXIT_REGISTERED = True
+            try:
+                atexit.register(shutdown_pool)
+            except Exception:
+                pass
+        return _LOOP
+
+
+def run_coro(coro: Any) -> Any:
+    """Run a coroutine on the persistent MCP loop and wait for its result."""
+    fut = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    return fut.result()
+
+
+def items_key(raw: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    """Hashable, order-independent form of a headers/env mapping for pool keys."""
+    return tuple(sorted((str(k), str(v)) for k, v in (raw or {}).items()))
+
+
+async def _hold_client(
+    client: MCPClient, ready: asyncio.Future, stop: asyncio.Event
+) -> None:
+    try:
+        async with client:
+            ready.set_result(client)
+            await stop.wait()
+    except BaseException as exc:
+        if not ready.done():
+            ready.set_exception(exc)
+        if not isinstance(exc, Exception):
+            raise
+
+
+async def _close_entry(
+    entry: tuple[MCPClient, asyncio.Event, asyncio.Task],
+) -> None:
+    _client, stop, task = entry
+    stop.set()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+async def acquire_client(
+    key: tuple[Any, ...], factory: Callable[[], MCPClient]
+) -> MCPClient:
+    """Return a connected client for key, connecting on first use.
+
+    Must run on the pool loop (see run_coro). When the pool grows past
+    MAX_POOL_SIZE the least recently used idle client is closed.
+    """
+    entry = _POOL.get(key)
+    if entry is not None:
+        if not entry[2].done():
+            _POOL.move_to_end(key)
+            return entry[0]
+        _POOL.pop(key, None)
+
+    pending = _POOL_PENDING.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future = loop.create_future()
+    _POOL_PENDING[key] = ready
+    stop = asyncio.Event()
+    client = factory()
+    task = loop.create_task(_hold_client(client, ready, stop))
+    try:
+        await asyncio.shield(ready)
+    finally:
+        _POOL_PENDING.pop(key, None)
+    _POOL[key] = (client, stop, task)
+    # Close the least recently used idle clients; a client a concurrent call
+    # is still using is skipped, even if that leaves the pool over the cap.
+    for old_key in list(_POOL):
+        if len(_POOL) <= MAX_POOL_SIZE:
+            break
+        if old_key != key and not _IN_USE.get(old_key):
+            await _close_entry(_POOL.pop(old_key))
+    return client
+
+
+async def evict_client(key: tuple[Any, ...]) -> None:
+    """Close and forget the pooled client for key, if any."""
+    entry = _POOL.pop(key, None)
+    if entry is not None:
+        await _close_entry(entry)
+
+
+def _failure_cause(exc: BaseException) -> BaseException:
+    if isinstance(exc, MCPTransportError) and exc.__cause__ is not None:
+        return exc.__cause__
+    return exc
+
+
+async def call_pooled(
+    key: tuple[Any, ...],
+    factory: Callable[[], MCPClient],
+    op: Callable[[MCPClient], Awaitable[Any]],
+) -> Any:
+    """Run op on the pooled client for key and return its result.
+
+    The client is evicted only when its connection is gone; a request that
+    merely failed (tool error, timeout) leaves it pooled. op is retried
+    once on a new connection only when it provably never reached the
+    server (client not connected, or its stream already closed), so
+    non-idempotent tool calls are never sent twice.
+    """
+    for attempt in range(2):
+        _IN_USE[key] = _IN_USE.get(key, 0) + 1
+        try:
+            client = await acquire_client(key, factory)
+            return await op(client)
+        except Exception as exc:
+            cause = _failure_cause(exc)
+            entry = _POOL.get(key)
+            unsent = isinstance(cause, _UNSENT_CAUSES) or (
+                isinstance(exc, MCPTransportError) and exc.code == "MCP_NOT_CONNECTED"
+            )
+            dead = (
+                unsent
+                or isinstance(cause, _DEAD_CAUSES)
+                or (entry is not None and entry[2].done())
+            )
+            if not dead:
+                raise
+            await evict_client(key)
+            if attempt or not unsent:
+                raise
+        finally:
+            left = _IN_USE.get(key, 1) - 1
+            if left:
+                _IN_USE[key] = left
+            else:
+                _IN_USE.pop(key, None)
+
+
+async def _close_all_clients() -> None:
+    for key in list(_POOL):
+        await evict_client(key)
+
+
+def shutdown_pool() -> None:
+    """Close pooled MCP connections and stop the loop thread."""
+    global _LOOP
+    with _LOOP_LOCK:
+        loop = _LOOP
+        _LOOP = None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_all_clients(), loop).result(timeout=5.0)
+    except Exception:
+        pass
+    try:
+        loop.call_soon_threadsafe(loop.stop)
+    except Exception:
+        pass
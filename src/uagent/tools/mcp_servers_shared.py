@@ -1,8 +1,81 @@
 # MCP configuration shared utilities
 from __future__ import annotations
 
+import functools
 import os
-import json
+from typing import Any
+
+from ..utils.json_codec import json_dumps, json_loads
+
+# path -> ((st_mtime_ns, st_size), parsed JSON) of the last load.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+# path -> (parsed config it was built from, {server name: server entry})
+_NAME_INDEX_CACHE: dict[str, tuple[Any, dict[Any, dict[str, Any]]]] = {}
+
+
+def load_config_cached(path: str) -> Any:
+    """Parse the JSON file at path, reusing the last parse while unchanged.
+
+    The file is re-read when its (st_mtime_ns, st_size) changes. Errors
+    propagate as from a plain open/parse. The returned object is shared:
+    callers must copy before mutating.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _CONFIG_CACHE.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
+    _CONFIG_CACHE[path] = (stamp, data)
+    return data
+
+
+def load_servers_by_name(path: str) -> dict[Any, dict[str, Any]]:
+    """Return the mcp_servers entries of the config at path, indexed by name.
+
+    Built on load_config_cached; the index is rebuilt only when the parse
+    changes. The first entry wins when names are duplicated. The returned
+    dict and entries are shared: callers must not mutate them.
+    """
+    config = load_config_cached(path)
+    hit = _NAME_INDEX_CACHE.get(path)
+    if hit is not None and hit[0] is config:
+        return hit[1]
+
+    servers = config.get("mcp_servers") if isinstance(config, dict) else None
+    by_name: dict[Any, dict[str, Any]] = {}
+    for s in servers if isinstance(servers, list) else []:
+        if isinstance(s, dict):
+            by_name.setdefault(s.get("name"), s)
+    _NAME_INDEX_CACHE[path] = (config, by_name)
+    return by_name
+
+
+def invalidate_config_cache(path: str | None = None) -> None:
+    """Drop the cached parse for path (or all paths)."""
+    if path is None:
+        _CONFIG_CACHE.clear()
+        _NAME_INDEX_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(path, None)
+        _NAME_INDEX_CACHE.pop(path, None)
+
+
+# Environment variables that feed into the default config path.
+_DEFAULT_PATH_ENV_KEYS = (
+    "UAGENT_MCP_CONFIG",
+    "UAGENT_STATE_DIR",
+    "HOME",
+    "USERPROFILE",
+)
+
+
+@functools.cache
+def _resolve_default_mcp_config_path(env_key: tuple[str | None, ...]) -> str:
+    from uagent.utils.paths import get_mcp_servers_json_path
+
+    return str(get_mcp_servers_json_path())
 
 
 def get_default_mcp_config_path() -> str:
@@ -11,10 +84,20 @@ def get_default_mcp_config_path() -> str:
     Priority:
     1. Environment variable UAGENT_MCP_CONFIG
     2. <state>/mcps/mcp_servers.json (Default: ~/.uag/mcps/mcp_servers.json)
+
+    The resolved path is memoized per value of the relevant environment
+    variables and the cwd, so changing either takes effect on the next call
+    (a relative UAGENT_MCP_CONFIG is resolved against the current cwd).
     """
-    from uagent.utils.paths import get_mcp_servers_json_path
+    env = os.environ
+    return _resolve_default_mcp_config_path(
+        (*(env.get(k) for k in _DEFAULT_PATH_ENV_KEYS), os.getcwd())
+    )
 
-    return str(get_mcp_servers_json_path())
+
+def invalidate_default_path_cache() -> None:
+    """Forget memoized results of get_default_mcp_config_path()."""
+    _resolve_default_mcp_config_path.cache_clear()
 
 
 def ensure_mcp_config_template() -> str:
@@ -34,8 +117,9 @@ def ensure_mcp_config_template() -> str:
     data = {"mcp_servers": []}
 
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = json_dumps(data, pretty=True).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(payload)
     except Exception:
         pass
 
@@ -6,15 +6,30 @@ _ = make_tool_translator(__file__)
 
 import json
 import os
+import shutil
+from collections import Counter
 from typing import Any
 
+from ..utils.json_codec import json_dumps
+
 try:
-    from .mcp_servers_shared import get_default_mcp_config_path
+    from .mcp_servers_shared import (
+        get_default_mcp_config_path,
+        invalidate_config_cache,
+        load_config_cached,
+    )
 except Exception:  # pragma: no cover
 
     def get_default_mcp_config_path() -> str:
         return "mcp_servers.json"
 
+    def load_config_cached(path: str) -> Any:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+    def invalidate_config_cache(path: str | None = None) -> None:
+        return None
+
 
 TOOL_SPEC: dict[str, Any] = {
     "type": "function",
@@ -233,9 +248,7 @@ TOOL_SPEC: dict[str, Any] = {
 
 
 def _json_out(obj: dict[str, Any], *, pretty: bool) -> str:
-    return json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None) + (
-        "\n" if pretty else ""
-    )
+    return json_dumps(obj, pretty=pretty) + ("\n" if pretty else "")
 
 
 def _load_config(
@@ -254,7 +267,10 @@ def _load_config(
     warnings: list[str] = []
     errors: list[str] = []
 
-    if not os.path.exists(path):
+    try:
+        data = load_config_cached(path)
+    except FileNotFoundError:
+        # EAFP: the stat inside load_config_cached doubles as the existence check.
         if missing_is_error and not create_if_missing:
             errors.append(
                 _("err.not_exists", default="ERROR: {path!r} does not exist").format(
@@ -279,10 +295,6 @@ def _load_config(
             ).format(path=path)
         )
         return {"mcp_servers": []}, warnings, errors
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
     except Exception as e:
         errors.append(
             _(
@@ -296,6 +308,9 @@ def _load_config(
         errors.append(_("err.root_not_dict", default="ERROR: root is not a dictionary"))
         return {"mcp_servers": []}, warnings, errors
 
+    # The parse is cached and shared; actions reorder/replace entries but
+    # never mutate them in place, so shallow copies are enough.
+    data = dict(data)
     servers = data.get("mcp_servers")
     if servers is None:
         warnings.append(
@@ -312,20 +327,60 @@ def _load_config(
         )
         servers = []
 
-    data["mcp_servers"] = servers
+    data["mcp_servers"] = list(servers)
     return data, warnings, errors
 
 
-def _save_config(path: str, data: dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+def _save_config(path: str, data: dict[str, Any]) -> bool:
+    """Write config atomically. Returns False when the file already matches."""
+    # Serialize up front: json.dump with indent writes one small chunk per
+    # token, and a failed encode would leave a truncated file behind.
+    payload = (json_dumps(data, pretty=True) + "\n").encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return False
+    except OSError:
+        pass
+
+    import tempfile
+
+    dirpath = os.path.dirname(path) or "."
+    os.makedirs(dirpath, exist_ok=True)
+    tmp_fd, tmp_name = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=dirpath
+    )
+    try:
+        with os.fdopen(tmp_fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates the file 0600; keep the permissions of the file
+        # being replaced.
+        try:
+            shutil.copymode(path, tmp_name)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+        invalidate_config_cache(path)
+    finally:
+        try:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+        except Exception:
+            pass
+    return True
+
+
+def _has_mcp_suffix(url: str) -> bool:
+    # Most URLs carry no trailing whitespace; only strip when the plain check fails.
+    return url.endswith("/mcp") or url.rstrip().endswith("/mcp")
 
 
 def _validate_servers_for_list(servers: list[Any]) -> list[str]:
+    if not servers:
+        return []
+
     warnings: list[str] = []
-    seen: dict[str, int] = {}
+    seen: Counter[str] = Counter()
 
     for idx, s in enumerate(servers):
         if not isinstance(s, dict):
@@ -341,7 +396,7 @@ def _validate_servers_for_list(servers: list[Any]) -> list[str]:
         url = s.get("url")
         command = s.get("command")
 
-        if not isinstance(name, str) or not name.strip():
+        if not isinstance(name, str) or not name or name.isspace():
             warnings.append(
                 _(
                     "warn.name_missing",
@@ -349,11 +404,11 @@ def _validate_servers_for_list(servers: list[Any]) -> list[str]:
                 ).format(idx=idx)
             )
         else:
-            seen[name] = seen.get(name, 0) + 1
+            seen[name] += 1
 
         # http server
-        if isinstance(url, str) and url.strip():
-            if not url.rstrip().endswith("/mcp"):
+        if isinstance(url, str) and url and not url.isspace():
+            if not _has_mcp_suffix(url):
                 warnings.append(
                     _(
                         "warn.url_no_mcp",
@@ -361,7 +416,7 @@ def _validate_servers_for_list(servers: list[Any]) -> list[str]:
                     ).format(idx=idx, url=url)
                 )
         # stdio server
-        elif isinstance(command, str) and command.strip():
+        elif isinstance(command, str) and command and not command.isspace():
             pass
         else:
             warnings.append(
@@ -387,7 +442,7 @@ def _validate_servers_strict(servers: list[Any]) -> tuple[list[str], list[str]]:
     warnings: list[str] = []
     errors: list[str] = []
 
-    seen: dict[str, int] = {}
+    seen: Counter[str] = Counter()
 
     for idx, s in enumerate(servers):
         if not isinstance(s, dict):
@@ -403,7 +458,7 @@ def _validate_servers_strict(servers: list[Any]) -> tuple[list[str], list[str]]:
         url = s.get("url")
         command = s.get("command")
 
-        if not isinstance(name, str) or not name.strip():
+        if not isinstance(name, str) or not name or name.isspace():
             errors.append(
                 _(
                     "err.name_missing",
@@ -411,10 +466,10 @@ def _validate_servers_strict(servers: list[Any]) -> tuple[list[str], list[str]]:
                 ).format(idx=idx)
             )
         else:
-            seen[name] = seen.get(name, 0) + 1
+            seen[name] += 1
 
-        has_http = isinstance(url, str) and url.strip()
-        has_stdio = isinstance(command, str) and command.strip()
+        has_http = isinstance(url, str) and bool(url) and not url.isspace()
+        has_stdio = isinstance(command, str) and bool(command) and not command.isspace()
 
         if not has_http and not has_stdio:
             errors.append(
@@ -424,7 +479,7 @@ def _validate_servers_strict(servers: list[Any]) -> tuple[list[str], list[str]]:
                 ).format(idx=idx)
             )
 
-        if has_http and not str(url).rstrip().endswith("/mcp"):
+        if has_http and not _has_mcp_suffix(str(url)):
             warnings.append(
                 _(
                     "warn.url_no_mcp",
@@ -515,11 +570,12 @@ def _run_action_list(args: dict[str, Any], *, pretty: bool, config_path: str) ->
     warnings = list(load_warn)
     errors = list(load_err)
 
-    if do_validate:
-        warnings.extend(_validate_servers_for_list(servers))
-
     view_servers = servers[:1] if default_only else servers
 
+    # Only what is shown gets checked; default_only skips the rest.
+    if do_validate:
+        warnings.extend(_validate_servers_for_list(view_servers))
+
     out_obj: dict[str, Any] = {
         "ok": len(errors) == 0,
         "action": action,
@@ -899,9 +955,9 @@ def _mcp_resolve_remove_index(
         return idx, None
 
     target = str(name).strip()
-    for i, s in enumerate(servers):
-        if isinstance(s, dict) and s.get("name") == target:
-            return i, None
+    idx = _mcp_find_server_index_by_name(servers, target)
+    if idx is not None:
+        return idx, None
 
     return None, _json_out(
         {
@@ -5,13 +5,16 @@ from .i18n_helper import make_tool_translator
 _ = make_tool_translator(__file__)
 
 import json
-import asyncio
 import os
+import time
 from dataclasses import asdict, is_dataclass
 from ..env_utils import env_get
-from typing import Any
+from ..utils.json_codec import json_dumps
+from typing import Any, Callable
 
 from .mcp.client import MCPClient
+from .mcp_pool import call_pooled, items_key, run_coro
+from .mcp_servers_shared import load_servers_by_name
 
 try:
     from .mcp_servers_shared import get_default_mcp_config_path
@@ -91,6 +94,22 @@ TOOL_SPEC: dict[str, Any] = {
                     ),
                     "default": "auto",
                 },
+                "refresh": {
+                    "type": "boolean",
+                    "description": _(
+                        "param.refresh.description",
+                        default="If true, ignore the cached tool list and query the server again.",
+                    ),
+                    "default": False,
+                },
+                "cache_ttl": {
+                    "type": "number",
+                    "description": _(
+                        "param.cache_ttl.description",
+                        default="Seconds a previous tool list for the same server is reused (default: 30).",
+                    ),
+                    "default": 30,
+                },
             },
             "required": [],
         },
@@ -98,6 +117,49 @@ TOOL_SPEC: dict[str, Any] = {
 }
 
 
+# Tool catalogs rarely change; serve repeat listings from memory for a while.
+_TOOLS_CACHE_TTL_S = 30.0
+# pool key -> (time.monotonic() of the listing, result)
+_TOOLS_CACHE: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+# Same cap handle_mcp_v2 applies to tool results.
+_OUTPUT_LIMIT = 200_000
+
+
+def _dump_bounded(result: dict[str, Any], limit: int, pretty: bool) -> str:
+    """Serialize a listing result, keeping the JSON under limit chars.
+
+    The result is encoded once; only when that exceeds the limit are
+    trailing tools dropped (marked with "truncated"/"tools_omitted") so the
+    output stays valid JSON.
+    """
+    text = json_dumps(result, pretty=pretty)
+    if len(text) <= limit:
+        return text
+
+    tools_list = result.get("tools_list")
+    tools = tools_list.get("tools") if isinstance(tools_list, dict) else None
+    if not isinstance(tools, list) or not tools:
+        return text
+
+    def _encode(keep: int) -> str:
+        trimmed = dict(result)
+        trimmed["tools_list"] = {**tools_list, "tools": tools[:keep]}
+        trimmed["truncated"] = True
+        trimmed["tools_omitted"] = len(tools) - keep
+        return json_dumps(trimmed, pretty=pretty)
+
+    # Largest number of leading tools that still fits.
+    lo, hi = 0, len(tools) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if len(_encode(mid)) <= limit:
+            lo = mid
+        else:
+            hi = mid - 1
+    return _encode(lo)
+
+
 def _to_jsonable(value: Any) -> Any:
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
@@ -156,51 +218,63 @@ def _resolve_http_headers(raw: Any) -> dict[str, str]:
     return out
 
 
+def _describe_tools(tools_result: Any) -> list[dict[str, Any]]:
+    raw_tools = getattr(tools_result, "tools", []) or (
+        tools_result.get("result", {}).get("tools", [])
+        if isinstance(tools_result, dict)
+        else []
+    )
+    tools = []
+    for tool in raw_tools or []:
+        tools.append(
+            {
+                "name": (tool.get("name") if isinstance(tool, dict) else tool.name),
+                "description": (
+                    tool.get("description")
+                    if isinstance(tool, dict)
+                    else tool.description
+                ),
+                "inputSchema": _to_jsonable(
+                    (tool.get("inputSchema") or tool.get("input_schema", {}))
+                    if isinstance(tool, dict)
+                    else getattr(tool, "inputSchema", None)
+                    or getattr(tool, "input_schema", {})
+                ),
+            }
+        )
+    return tools
+
+
+async def _list_with_pooled_client(
+    key: tuple[Any, ...], factory: Callable[[], MCPClient]
+) -> tuple[MCPClient, list[dict[str, Any]]]:
+    """List tools over the shared MCP connection pool (see mcp_pool).
+
+    Warm calls skip the transport setup and initialize handshake; a dead
+    pooled client is replaced on the next call (see call_pooled).
+    """
+
+    async def _op(client: MCPClient) -> tuple[MCPClient, list[dict[str, Any]]]:
+        return client, _describe_tools(await client.list_tools())
+
+    return await call_pooled(key, factory, _op)
+
+
 async def _mcp_tools_list_http(
     url: str,
     headers: dict[str, str] | None = None,
     protocol_mode: str = "auto",
 ) -> dict[str, Any]:
-    async with MCPClient(
-        url=url, headers=headers or {}, protocol_mode=protocol_mode
-    ) as client:
-        tools_result = await client.list_tools()
-        raw_tools = (
-            getattr(tools_result, "tools", [])
-            or (
-                tools_result.get("result", {}).get("tools", [])
-                if isinstance(tools_result, dict)
-                else []
-            )
-        )
-        tools = []
-        for tool in raw_tools or []:
-            tools.append(
-                {
-                    "name": (
-                        tool.get("name") if isinstance(tool, dict) else tool.name
-                    ),
-                    "description": (
-                        tool.get("description")
-                        if isinstance(tool, dict)
-                        else tool.description
-                    ),
-                    "inputSchema": _to_jsonable(
-                        (
-                            tool.get("inputSchema") or tool.get("input_schema", {})
-                        )
-                        if isinstance(tool, dict)
-                        else getattr(tool, "inputSchema", None)
-                        or getattr(tool, "input_schema", {})
-                    ),
-                }
-            )
-        return {
-            "url": client.url,
-            "initialize": _to_jsonable(client.initialize_result),
-            "protocol": _to_jsonable(client.protocol_info),
-            "tools_list": {"tools": tools},
-        }
+    client, tools = await _list_with_pooled_client(
+        ("http", url, items_key(headers), protocol_mode),
+        lambda: MCPClient(url=url, headers=headers or {}, protocol_mode=protocol_mode),
+    )
+    return {
+        "url": client.url,
+        "initialize": _to_jsonable(client.initialize_result),
+        "protocol": _to_jsonable(client.protocol_info),
+        "tools_list": {"tools": tools},
+    }
 
 
 async def _mcp_tools_list_stdio(
@@ -209,47 +283,19 @@ async def _mcp_tools_list_stdio(
     env: dict[str, str],
     protocol_mode: str = "auto",
 ) -> dict[str, Any]:
-    async with MCPClient(
-        command=command, args=args, env=env, protocol_mode=protocol_mode
-    ) as client:
-        tools_result = await client.list_tools()
-        raw_tools = (
-            getattr(tools_result, "tools", [])
-            or (
-                tools_result.get("result", {}).get("tools", [])
-                if isinstance(tools_result, dict)
-                else []
-            )
-        )
-        tools = []
-        for tool in raw_tools or []:
-            tools.append(
-                {
-                    "name": (
-                        tool.get("name") if isinstance(tool, dict) else tool.name
-                    ),
-                    "description": (
-                        tool.get("description")
-                        if isinstance(tool, dict)
-                        else tool.description
-                    ),
-                    "inputSchema": _to_jsonable(
-                        (
-                            tool.get("inputSchema") or tool.get("input_schema", {})
-                        )
-                        if isinstance(tool, dict)
-                        else getattr(tool, "inputSchema", None)
-                        or getattr(tool, "input_schema", {})
-                    ),
-                }
-            )
-        return {
-            "command": command,
-            "args": args,
-            "initialize": _to_jsonable(client.initialize_result),
-            "protocol": _to_jsonable(client.protocol_info),
-            "tools_list": {"tools": tools},
-        }
+    client, tools = await _list_with_pooled_client(
+        ("stdio", command, tuple(args), items_key(env), protocol_mode),
+        lambda: MCPClient(
+            command=command, args=args, env=env, protocol_mode=protocol_mode
+        ),
+    )
+    return {
+        "command": command,
+        "args": args,
+        "initialize": _to_jsonable(client.initialize_result),
+        "protocol": _to_jsonable(client.protocol_info),
+        "tools_list": {"tools": tools},
+    }
 
 
 def run_tool(args: dict[str, Any]) -> str:
@@ -268,34 +314,25 @@ def run_tool(args: dict[str, Any]) -> str:
     if (not url) and server_name:
         try:
             config_path = str(get_default_mcp_config_path())
-            if config_path and os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-
-                servers = cfg.get("mcp_servers") if isinstance(cfg, dict) else []
-                if isinstance(servers, list):
-                    for s in servers:
-                        if isinstance(s, dict) and s.get("name") == server_name:
-                            url = s.get("url")
-                            command = str(s.get("command") or "")
-                            raw_args = s.get("args") or []
-                            cmd_args = (
-                                [str(x) for x in raw_args]
-                                if isinstance(raw_args, list)
-                                else []
-                            )
-                            raw_env = s.get("env") or {}
-                            cmd_env = (
-                                {str(k): str(v) for k, v in raw_env.items()}
-                                if isinstance(raw_env, dict)
-                                else {}
-                            )
-                            http_headers = _resolve_http_headers(s.get("headers"))
-                            if "protocol_mode" not in args:
-                                protocol_mode = str(
-                                    s.get("protocol_mode") or "auto"
-                                ).strip().lower()
-                            break
+            s = load_servers_by_name(config_path).get(server_name)
+            if s is not None:
+                url = s.get("url")
+                command = str(s.get("command") or "")
+                raw_args = s.get("args") or []
+                cmd_args = (
+                    [str(x) for x in raw_args] if isinstance(raw_args, list) else []
+                )
+                raw_env = s.get("env") or {}
+                cmd_env = (
+                    {str(k): str(v) for k, v in raw_env.items()}
+                    if isinstance(raw_env, dict)
+                    else {}
+                )
+                http_headers = _resolve_http_headers(s.get("headers"))
+                if "protocol_mode" not in args:
+                    protocol_mode = (
+                        str(s.get("protocol_mode") or "auto").strip().lower()
+                    )
         except Exception:
             pass
 
@@ -316,30 +353,49 @@ def run_tool(args: dict[str, Any]) -> str:
             ensure_ascii=False,
         )
 
-    try:
-        # 1) stdio via configured command
-        if (not url) and command:
-            result = asyncio.run(
-                _mcp_tools_list_stdio(command, cmd_args, cmd_env, protocol_mode)
-            )
+    # 1) stdio via configured command
+    if (not url) and command:
+        key: tuple[Any, ...] = (
+            "stdio",
+            command,
+            tuple(cmd_args),
+            items_key(cmd_env),
+            protocol_mode,
+        )
 
-        # 2) stdio shorthand url
-        elif isinstance(url, str) and url.startswith("stdio://"):
-            cmd = url[len("stdio://") :]
-            # no args/env in shorthand
-            result = asyncio.run(
-                _mcp_tools_list_stdio(cmd, [], {}, protocol_mode)
-            )
+        def _make() -> Any:
+            return _mcp_tools_list_stdio(command, cmd_args, cmd_env, protocol_mode)
+
+    # 2) stdio shorthand url
+    elif isinstance(url, str) and url.startswith("stdio://"):
+        cmd = url[len("stdio://") :]
+        # no args/env in shorthand
+        key = ("stdio", cmd, (), (), protocol_mode)
+
+        def _make() -> Any:
+            return _mcp_tools_list_stdio(cmd, [], {}, protocol_mode)
 
-        # 3) http
+    # 3) http
+    else:
+        key = ("http", str(url), items_key(http_headers), protocol_mode)
+
+        def _make() -> Any:
+            return _mcp_tools_list_http(str(url), http_headers, protocol_mode)
+
+    try:
+        ttl = float(args.get("cache_ttl", _TOOLS_CACHE_TTL_S))
+    except (TypeError, ValueError):
+        ttl = _TOOLS_CACHE_TTL_S
+
+    try:
+        hit = None if args.get("refresh") else _TOOLS_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            result = hit[1]
         else:
-            result = asyncio.run(
-                _mcp_tools_list_http(str(url), http_headers, protocol_mode)
-            )
+            result = run_coro(_make())
+            _TOOLS_CACHE[key] = (time.monotonic(), result)
 
-        if pretty:
-            return json.dumps(result, ensure_ascii=False, indent=2)
-        return json.dumps(result, ensure_ascii=False)
+        return _dump_bounded(result, _OUTPUT_LIMIT, pretty)
 
     except Exception as e:
         return json.dumps(
@@ -77,29 +77,7 @@ TOOL_SPEC: dict[str, Any] = {
 }
 
 
-def run_playwright_inspector(
-    url: str = "about:blank", prefix: str = "debug_capture"
-) -> str:
-    """Launch Playwright Inspector and save the state and navigation snapshots after user operations."""
-
-    _emit_debug(f"Launching Playwright Inspector: url={url!r}, prefix={prefix!r}")
-
-    payload = {
-        "url": url,
-        "prefix": prefix,
-        "started_at": time.time(),
-        "ui_started": _("ui.started", default="--- PLAYWRIGHT INSPECTOR STARTED ---"),
-        "ui_resume_prompt": _(
-            "ui.resume_prompt",
-            default="After operations, please click Resume (▷) in the Inspector.",
-        ),
-        "ui_captured": _(
-            "ui.captured",
-            default="--- CAPTURED: {html}, {png}, {flow}, {snapshots}/ ---",
-        ),
-    }
-
-    logic_code = r"""
+_CHILD_SCRIPT = r"""
 import asyncio
 import json
 import os
@@ -110,11 +88,12 @@ from typing import Any, Dict, List
 
 import sys as _sys
 import os as _os
-_script_dir = _os.path.dirname(_os.path.abspath(__file__))
-_src_dir = _os.path.join(_script_dir, "src")
-if _os.path.isdir(_src_dir):
-    _sys.path.insert(0, _src_dir)
+# The script runs from the cache dir; the parent passes where uagent lives.
+_pkg_root = json.loads(_sys.argv[1]).get("pkg_root") if len(_sys.argv) > 1 else None
+if _pkg_root and _os.path.isdir(_pkg_root):
+    _sys.path.insert(0, _pkg_root)
 from uagent._pip_auto import install_playwright_with_chromium as _install_pw_inspector
+from uagent.utils.json_codec import json_dumps
 
 if not _install_pw_inspector():
     async_playwright = None
@@ -139,24 +118,58 @@ def _sanitize_for_filename(s: str, max_len: int = 80) -> str:
     return s
 
 
+def _dumps_line(obj: dict[str, Any]) -> bytes:
+    return (json_dumps(obj) + "\n").encode("utf-8")
+
+
 class FlowLogger:
+    # Busy pages emit thousands of events per second; lines are buffered and
+    # written in batches by flush_periodically() instead of one write each.
+    FLUSH_INTERVAL_S = 0.25
+    _instances: List["FlowLogger"] = []
+
     def __init__(self, path: str):
         self.path = path
-        self._fp = open(path, "a", encoding="utf-8")
+        self._fp = open(path, "ab", buffering=1 << 16)
+        self._buf: List[bytes] = []
+        FlowLogger._instances.append(self)
 
     def log(self, obj: dict[str, Any]) -> None:
         obj = dict(obj)
         obj.setdefault("ts", time.time())
         obj.setdefault("ts_iso", _now_iso())
-        self._fp.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        self._buf.append(_dumps_line(obj))
+
+    def flush(self) -> None:
+        if self._fp.closed:
+            return
+        if self._buf:
+            self._fp.writelines(self._buf)
+            self._buf.clear()
         self._fp.flush()
 
     def close(self) -> None:
         try:
+            self.flush()
             self._fp.close()
         except Exception:
             pass
 
+    @classmethod
+    async def flush_periodically(cls) -> None:
+        while True:
+            await asyncio.sleep(cls.FLUSH_INTERVAL_S)
+            for inst in cls._instances:
+                try:
+                    inst.flush()
+                except Exception:
+                    pass
+
+    @classmethod
+    def close_all(cls) -> None:
+        for inst in cls._instances:
+            inst.close()
+
 
 def make_event_record(event_type: str, page_id: str, **fields: Any) -> dict[str, Any]:
     record: dict[str, Any] = {"type": event_type, "page_id": page_id}
@@ -197,6 +210,7 @@ async def main() -> None:
 
     logger = FlowLogger(flow_path)
     index_logger = FlowLogger(index_path)
+    flusher = asyncio.create_task(FlowLogger.flush_periodically())
     page_seq = 0
 
     # Path for saving session state
@@ -489,21 +503,88 @@ async def main() -> None:
             print(f"Failed to save session state: {e}")
 
         await browser.close()
+        flusher.cancel()
         logger.close()
         index_logger.close()
         print(ui_captured.format(html=final_html, png=final_png, flow=flow_path, snapshots=snapshots_dir))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        # Don't lose buffered events when the capture ends abnormally.
+        FlowLogger.close_all()
 """
 
-    temp_script = f"temp_inspector_{os.getpid()}.py"
-    with open(temp_script, "w", encoding="utf-8") as f:
-        f.write(logic_code)
+_CHILD_SCRIPT_PATH: str | None = None
+
+
+def _child_script_path() -> str:
+    """Return the path of the child script, writing it on first use.
 
+    The file lives in the cache dir and its name carries a hash of the
+    script, so edits to _CHILD_SCRIPT get a fresh file and repeat captures
+    reuse the existing one.
+    """
+    global _CHILD_SCRIPT_PATH
+    if _CHILD_SCRIPT_PATH is not None and os.path.exists(_CHILD_SCRIPT_PATH):
+        return _CHILD_SCRIPT_PATH
+
+    import hashlib
+    import tempfile
+
+    from uagent.utils.paths import get_cache_dir
+
+    data = _CHILD_SCRIPT.encode("utf-8")
+    digest = hashlib.sha1(data).hexdigest()[:8]
+    cache_dir = str(get_cache_dir())
+    path = os.path.join(cache_dir, f"playwright_inspector_child_{digest}.py")
     try:
-        argv = [sys.executable, temp_script, json.dumps(payload, ensure_ascii=False)]
+        up_to_date = os.path.getsize(path) == len(data)
+    except OSError:
+        up_to_date = False
+    if not up_to_date:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".playwright_inspector_", dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    _CHILD_SCRIPT_PATH = path
+    return path
+
+
+def run_playwright_inspector(
+    url: str = "about:blank", prefix: str = "debug_capture"
+) -> str:
+    """Launch Playwright Inspector and save the state and navigation snapshots after user operations."""
+
+    _emit_debug(f"Launching Playwright Inspector: url={url!r}, prefix={prefix!r}")
+
+    payload = {
+        "url": url,
+        "prefix": prefix,
+        "started_at": time.time(),
+        # The child script lives outside the source tree; let it import this uagent.
+        "pkg_root": os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "ui_started": _("ui.started", default="--- PLAYWRIGHT INSPECTOR STARTED ---"),
+        "ui_resume_prompt": _(
+            "ui.resume_prompt",
+            default="After operations, please click Resume (▷) in the Inspector.",
+        ),
+        "ui_captured": _(
+            "ui.captured",
+            default="--- CAPTURED: {html}, {png}, {flow}, {snapshots}/ ---",
+        ),
+    }
+
+    try:
+        script_path = _child_script_path()
+        argv = [sys.executable, script_path, json.dumps(payload, ensure_ascii=False)]
         result = subprocess.run(argv, capture_output=True, text=True)
         if result.returncode != 0:
             return _(
@@ -517,12 +598,6 @@ if __name__ == "__main__":
         ).format(prefix=prefix, stdout=result.stdout or "")
     except Exception as e:
         return f"[playwright_inspector error] {type(e).__name__}: {e}"
-    finally:
-        try:
-            if os.path.exists(temp_script):
-                os.remove(temp_script)
-        except Exception:
-            pass
 
 
 def run_tool(args: dict[str, Any]) -> str:
@@ -12,7 +12,7 @@ import math
 import threading
 import hashlib
 import requests
-from typing import Any
+from typing import Any, Callable
 
 from .._pip_auto import install_with_status
 
@@ -490,24 +490,13 @@ def _sync_file_bm25(fpath_abs: str, root_abs: str, db_path: str):
                 conn.close()
 
 
-def sync_file(fpath: str, root_dir: str = "."):
-    if not _ENABLE_SEMANTIC_SEARCH:
-        return None
-
-    fpath_abs = os.path.abspath(fpath)
-    if not os.path.isfile(fpath_abs):
-        return
-
-    root_abs = os.path.abspath(root_dir)
-    db_path = _get_db_path(root_abs)
-
-    if _BM25_MODE:
-        return _sync_file_bm25(fpath_abs, root_abs, db_path)
+def _with_db_retry(db_path: str, fpath_abs: str, fn: Callable[[Any], Any]) -> Any:
+    """Run fn(cursor) in one committed transaction under _DB_LOCK.
 
+    Retries with backoff while SQLite reports the database as locked.
+    """
     import time
 
-    _init_db(db_path)
-
     max_attempts = 5
     backoff_s = 0.2
 
@@ -522,54 +511,9 @@ def sync_file(fpath: str, root_dir: str = "."):
                 pass
 
             try:
-                mtime = os.path.getmtime(fpath_abs)
-                size = os.path.getsize(fpath_abs)
-
-                cur.execute("SELECT id, mtime FROM files WHERE path=?", (fpath_abs,))
-                row = cur.fetchone()
-
-                needs_update = False
-                file_id = None
-                if row:
-                    if abs(mtime - row[1]) > 1.0:
-                        needs_update = True
-                        file_id = row[0]
-                else:
-                    needs_update = True
-
-                if needs_update:
-                    with open(fpath_abs, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-
-                    if file_id:
-                        cur.execute("DELETE FROM vectors WHERE file_id=?", (file_id,))
-                        cur.execute(
-                            "UPDATE files SET mtime=?, file_size=? WHERE id=?",
-                            (mtime, size, file_id),
-                        )
-                    else:
-                        cur.execute(
-                            "INSERT INTO files (path, mtime, file_size) VALUES (?, ?, ?)",
-                            (fpath_abs, mtime, size),
-                        )
-                        file_id = cur.lastrowid
-
-                    chunks = _chunk_text(content)
-                    for i, chunk in enumerate(chunks):
-                        try:
-                            vec = _get_embedding(chunk)
-                        except Exception:
-                            continue
-                        if not vec:
-                            continue
-                        embedding_json = json.dumps(vec)
-                        cur.execute(
-                            "INSERT INTO vectors (file_id, chunk_index, text_content, embedding_json) VALUES (?, ?, ?, ?)",
-                            (file_id, i, chunk, embedding_json),
-                        )
-
-                    conn.commit()
-                return
+                result = fn(cur)
+                conn.commit()
+                return result
             except sqlite3.OperationalError as e:
                 msg = str(e).lower()
                 if "database is locked" in msg or "database table is locked" in msg:
@@ -583,6 +527,83 @@ def sync_file(fpath: str, root_dir: str = "."):
                 conn.close()
 
 
+def sync_file(fpath: str, root_dir: str = "."):
+    if not _ENABLE_SEMANTIC_SEARCH:
+        return None
+
+    fpath_abs = os.path.abspath(fpath)
+    if not os.path.isfile(fpath_abs):
+        return
+
+    root_abs = os.path.abspath(root_dir)
+    db_path = _get_db_path(root_abs)
+
+    if _BM25_MODE:
+        return _sync_file_bm25(fpath_abs, root_abs, db_path)
+
+    _init_db(db_path)
+
+    # Only the DB reads/writes run under _DB_LOCK; reading the file and the
+    # embedding API calls happen outside it so index_files can embed several
+    # files concurrently.
+    try:
+        mtime = os.path.getmtime(fpath_abs)
+        size = os.path.getsize(fpath_abs)
+    except Exception as e:
+        raise RuntimeError(f"Failed to index {fpath_abs}: {e}") from e
+
+    def _lookup(cur: sqlite3.Cursor) -> tuple[bool, int | None]:
+        cur.execute("SELECT id, mtime FROM files WHERE path=?", (fpath_abs,))
+        row = cur.fetchone()
+        if not row:
+            return True, None
+        return abs(mtime - row[1]) > 1.0, row[0]
+
+    needs_update, _file_id = _with_db_retry(db_path, fpath_abs, _lookup)
+    if not needs_update:
+        return
+
+    try:
+        with open(fpath_abs, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+    except Exception as e:
+        raise RuntimeError(f"Failed to index {fpath_abs}: {e}") from e
+
+    rows: list[tuple[int, str, str]] = []
+    for i, chunk in enumerate(_chunk_text(content)):
+        try:
+            vec = _get_embedding(chunk)
+        except Exception:
+            continue
+        if not vec:
+            continue
+        rows.append((i, chunk, json.dumps(vec)))
+
+    def _write(cur: sqlite3.Cursor) -> None:
+        # Re-read the row: another writer may have touched it meanwhile.
+        needs_update, file_id = _lookup(cur)
+        if not needs_update:
+            return
+        if file_id:
+            cur.execute("DELETE FROM vectors WHERE file_id=?", (file_id,))
+            cur.execute(
+                "UPDATE files SET mtime=?, file_size=? WHERE id=?",
+                (mtime, size, file_id),
+            )
+        else:
+            cur.execute(
+                "INSERT INTO files (path, mtime, file_size) VALUES (?, ?, ?)",
+                (fpath_abs, mtime, size),
+            )
+            file_id = cur.lastrowid
+        cur.executemany(
+            "INSERT INTO vectors (file_id, chunk_index, text_content, embedding_json) VALUES (?, ?, ?, ?)",
+            [(file_id, i, chunk, emb) for i, chunk, emb in rows],
+        )
+
+    _with_db_retry(db_path, fpath_abs, _write)
+
+
 def _semantic_search_bm25(
     query: str,
     root_abs: str,
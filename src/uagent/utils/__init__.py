@@ -25,6 +25,7 @@ from .paths import (
     get_tmp_dir,
     get_tmp_patch_dir,
 )
+from .json_codec import json_dumps, json_loads
 from .scan_filters import is_ignored_path, path_has_dirname
 from .secret_mask import (
     looks_like_password_field,
@@ -49,6 +50,9 @@ __all__ = [
     "get_files_dir",
     "get_mcps_dir",
     "get_mcp_servers_json_path",
+    # json_codec
+    "json_loads",
+    "json_dumps",
     # scan_filters
     "path_has_dirname",
     "is_ignored_path",
@@ -0,0 +1,50 @@
+"""JSON encode/decode helpers with an optional orjson fast path.
+
+orjson is used when installed (``pip install uag[fast-json]``); otherwise
+the stdlib json module is used. Both keep non-ASCII as-is, and ``pretty``
+gives the 2-space layout of ``json.dumps(indent=2)``. The orjson path
+differs from the stdlib one in these ways:
+
+- dumps: compact output has no spaces after ``,`` and ``:``; NaN and
+  +/-Infinity are written as ``null``; exponent floats use the short form
+  (``1e16`` rather than ``1e+16``).
+- loads: ``NaN``/``Infinity`` literals, lone surrogate escapes and
+  out-of-range numbers such as ``1e400`` are rejected; integers wider than
+  64 bits are returned as floats.
+
+Keep this module free of higher-layer imports (tools/LLM).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when available, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, *, pretty: bool = False) -> str:
+    """Serialize to JSON text (non-ASCII kept as-is; 2-space indent if pretty).
+
+    Falls back to the stdlib for values orjson rejects (e.g. integers wider
+    than 64 bits).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+
+
+def test_dump_trace_matches_full_dump_prefix() -> None:
+    from uagent.tools.graph_rag_search_tool import _dump_trace
+
+    trace = {
+        "seed_entity_ids": list(range(5)),
+        "visited_entity_ids": list(range(5000)),
+        "edges": [[i, i + 1, "rel"] for i in range(200)],
+    }
+    full = json.dumps(trace, ensure_ascii=False, indent=2)
+
+    assert _dump_trace(trace) == full[:4000]
+    assert _dump_trace(trace, limit=120) == full[:120]
+
+
+def test_dump_trace_small_trace_is_untouched() -> None:
+    from uagent.tools.graph_rag_search_tool import _dump_trace
+
+    trace = {"seed_entity_ids": [], "visited_entity_ids": [], "edges": []}
+    assert _dump_trace(trace) == json.dumps(trace, ensure_ascii=False, indent=2)
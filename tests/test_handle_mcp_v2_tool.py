@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -48,7 +49,7 @@ def test_handle_mcp_v2_uses_http_and_truncates(monkeypatch: pytest.MonkeyPatch)
     import uagent.tools.handle_mcp_v2_tool as m
     from uagent.tools.context import ToolCallbacks
 
-    def fake_asyncio_run(coro):
+    def fake_run_coro(coro):
         try:
             name = getattr(coro, "cr_code", None).co_name  # type: ignore[union-attr]
         except Exception:
@@ -60,7 +61,7 @@ def test_handle_mcp_v2_uses_http_and_truncates(monkeypatch: pytest.MonkeyPatch)
         assert name == "_call_mcp_http"
         return "HTTP_RESULT"
 
-    monkeypatch.setattr(m.asyncio, "run", fake_asyncio_run)
+    monkeypatch.setattr(m, "run_coro", fake_run_coro)
 
     cb = ToolCallbacks(
         truncate_output=lambda tool, text, limit: f"TRUNC({tool})[{text}]"
@@ -81,7 +82,7 @@ def test_handle_mcp_v2_stdio_url_uses_stdio(monkeypatch: pytest.MonkeyPatch) ->
     import uagent.tools.handle_mcp_v2_tool as m
     from uagent.tools.context import ToolCallbacks
 
-    def fake_asyncio_run(coro):
+    def fake_run_coro(coro):
         try:
             name = getattr(coro, "cr_code", None).co_name  # type: ignore[union-attr]
         except Exception:
@@ -93,7 +94,7 @@ def test_handle_mcp_v2_stdio_url_uses_stdio(monkeypatch: pytest.MonkeyPatch) ->
         assert name == "_call_mcp_stdio"
         return "STDIO_RESULT"
 
-    monkeypatch.setattr(m.asyncio, "run", fake_asyncio_run)
+    monkeypatch.setattr(m, "run_coro", fake_run_coro)
 
     cb = ToolCallbacks(
         truncate_output=lambda tool, text, limit: f"TRUNC({tool})[{text}]"
@@ -104,6 +105,166 @@ def test_handle_mcp_v2_stdio_url_uses_stdio(monkeypatch: pytest.MonkeyPatch) ->
     assert out == "TRUNC(handle_mcp_v2)[STDIO_RESULT]"
 
 
+def test_handle_mcp_v2_reuses_pooled_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.handle_mcp_v2_tool as m
+    from uagent.tools import mcp_pool
+    from uagent.tools.context import ToolCallbacks
+
+    events: list[str] = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        async def __aenter__(self):
+            events.append("enter")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append("exit")
+
+        async def call_tool(self, name, arguments):
+            events.append(f"call:{name}")
+            return f"OK:{name}"
+
+    monkeypatch.setattr(m, "MCPClient", FakeClient)
+    monkeypatch.setattr(m, "get_callbacks", lambda: ToolCallbacks())
+
+    try:
+        assert m.run_tool({"url": "http://pool.example", "tool_name": "a"}) == "OK:a"
+        assert m.run_tool({"url": "http://pool.example", "tool_name": "b"}) == "OK:b"
+        assert events == ["enter", "call:a", "call:b"]
+    finally:
+        mcp_pool.shutdown_pool()
+
+    assert events[-1] == "exit"
+
+
+def _failing_client_class(events: list[str], clients: list[Any]) -> type:
+    from uagent.tools.mcp.errors import MCPTransportError
+
+    class FakeClient:
+        # What the next call_tool raises as the MCPTransportError cause
+        # (None: succeed, "tool": a tool-level error without a cause).
+        fail_with: Any = None
+
+        def __init__(self, **kwargs):
+            self.n = len(clients) + 1
+            self.fail_with = FakeClient.fail_with
+            clients.append(self)
+
+        async def __aenter__(self):
+            events.append(f"enter:{self.n}")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append(f"exit:{self.n}")
+
+        async def call_tool(self, name, arguments):
+            events.append(f"call:{self.n}:{name}")
+            if self.fail_with is None:
+                return f"OK:{name}"
+            err = MCPTransportError("MCP_CALL_TOOL_FAILED", "tools/call")
+            if self.fail_with == "tool":
+                raise err
+            raise err from self.fail_with
+
+    return FakeClient
+
+
+def test_handle_mcp_v2_retries_unsent_call_on_fresh_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import anyio
+
+    import uagent.tools.handle_mcp_v2_tool as m
+    from uagent.tools import mcp_pool
+    from uagent.tools.context import ToolCallbacks
+
+    events: list[str] = []
+    clients: list[Any] = []
+    FakeClient = _failing_client_class(events, clients)
+    monkeypatch.setattr(m, "MCPClient", FakeClient)
+    monkeypatch.setattr(m, "get_callbacks", lambda: ToolCallbacks())
+
+    def call(name: str) -> str:
+        return m.run_tool({"url": "http://dead.example", "tool_name": name})
+
+    try:
+        assert call("a") == "OK:a"
+        # The pooled connection closed between calls: the write fails before
+        # anything is sent, so the call is replayed on a new connection.
+        clients[0].fail_with = anyio.ClosedResourceError()
+        assert call("b") == "OK:b"
+        assert events == [
+            "enter:1",
+            "call:1:a",
+            "call:1:b",
+            "exit:1",
+            "enter:2",
+            "call:2:b",
+        ]
+
+        # Only one retry: a fresh client that also fails surfaces the error.
+        clients[1].fail_with = anyio.ClosedResourceError()
+        FakeClient.fail_with = anyio.ClosedResourceError()
+        events.clear()
+        assert call("c").startswith("[Error] MCP http call failed")
+        assert events == ["call:2:c", "exit:2", "enter:3", "call:3:c", "exit:3"]
+    finally:
+        mcp_pool.shutdown_pool()
+
+
+@pytest.mark.parametrize(
+    ("fail_with", "evicted"),
+    [("tool", False), (TimeoutError(), False), (EOFError(), True)],
+)
+def test_handle_mcp_v2_never_resends_a_sent_call(
+    monkeypatch: pytest.MonkeyPatch, fail_with: Any, evicted: bool
+) -> None:
+    import uagent.tools.handle_mcp_v2_tool as m
+    from uagent.tools import mcp_pool
+    from uagent.tools.context import ToolCallbacks
+
+    events: list[str] = []
+    clients: list[Any] = []
+    monkeypatch.setattr(m, "MCPClient", _failing_client_class(events, clients))
+    monkeypatch.setattr(m, "get_callbacks", lambda: ToolCallbacks())
+
+    def call(name: str) -> str:
+        return m.run_tool({"url": "http://sent.example", "tool_name": name})
+
+    try:
+        assert call("a") == "OK:a"
+        clients[0].fail_with = fail_with
+        assert call("b").startswith("[Error] MCP http call failed")
+        # Sent once; only a dead connection is dropped from the pool.
+        assert events == ["enter:1", "call:1:a", "call:1:b"] + (
+            ["exit:1"] if evicted else []
+        )
+        clients[0].fail_with = None
+        assert call("c") == "OK:c"
+        assert len(clients) == (2 if evicted else 1)
+    finally:
+        mcp_pool.shutdown_pool()
+
+
+def test_masked_args_for_log_masks_top_level_only_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.handle_mcp_v2_tool as m
+
+    argv = {"a": {"b": [1, 2]}, "c": "secret"}
+
+    monkeypatch.delenv("UAGENT_DEBUG_TOOLS", raising=False)
+    assert m._masked_args_for_log(argv) == {"a": "*", "c": "*"}
+
+    monkeypatch.setenv("UAGENT_DEBUG_TOOLS", "1")
+    assert m._masked_args_for_log(argv) == {"a": {"b": ["*", "*"]}, "c": "*"}
+
+
 def test_format_result_saves_returned_file_payload(
     repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -130,6 +130,26 @@ def test_cmd_exec_json_rejects_invalid_cwd_type() -> None:
     raise AssertionError("expected ValueError for non-string cwd")
 
 
+def test_cmd_exec_json_run_argv_passes_arguments_verbatim() -> None:
+    import sys
+
+    from uagent.tools.cmd_exec_json_tool import run_argv
+
+    arg = "a b; $HOME && 'q'"
+    out = run_argv([sys.executable, "-c", "import sys; print(sys.argv[1])", arg])
+    obj = _loads(out)
+    assert obj["ok"] is True
+    assert obj["stdout"].strip() == arg
+
+
+def test_cmd_exec_json_run_argv_applies_block_rules() -> None:
+    from uagent.tools.cmd_exec_json_tool import run_argv
+
+    obj = _loads(run_argv(["shutdown", "/s", "/t", "0"]))
+    assert obj["ok"] is False
+    assert obj["blocked"] is True
+
+
 def test_delete_file_glob_execute_confirmed(monkeypatch, repo_tmp_path: Path) -> None:
     from uagent.tools.delete_file_tool import run_tool
 
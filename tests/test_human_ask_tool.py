@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+
+def _install_callbacks(monkeypatch: pytest.MonkeyPatch) -> dict:
+    import uagent.tools.human_ask_tool as m
+    from uagent.tools.context import ToolCallbacks
+
+    state: dict = {"active": False, "queue": None, "lines": [], "password": False}
+    cb = ToolCallbacks(
+        human_ask_lock=threading.Lock(),
+        human_ask_active_ref=lambda: state["active"],
+        human_ask_set_active=lambda v: state.__setitem__("active", v),
+        human_ask_queue_ref=lambda: state["queue"],
+        human_ask_set_queue=lambda q: state.__setitem__("queue", q),
+        human_ask_lines_ref=lambda: state["lines"],
+        human_ask_set_multiline_active=lambda v: None,
+        human_ask_set_password=lambda v: state.__setitem__("password", v),
+        is_gui=True,
+    )
+    monkeypatch.setattr(m, "get_callbacks", lambda: cb)
+    return state
+
+
+def _reply_when_ready(state: dict, text: str) -> threading.Thread:
+    def _producer() -> None:
+        for _ in range(500):
+            q = state["queue"]
+            if q is not None:
+                q.put(text)
+                return
+            time.sleep(0.01)
+
+    t = threading.Thread(target=_producer, daemon=True)
+    t.start()
+    return t
+
+
+def test_human_ask_receives_reply_from_host_queue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.human_ask_tool as m
+
+    state = _install_callbacks(monkeypatch)
+
+    for text in ("first\r\nsecond", "again"):
+        t = _reply_when_ready(state, text)
+        out = json.loads(m.run_tool({"message": "q"}))
+        t.join(timeout=5)
+        assert out["user_reply"] == text
+        assert out["cancelled"] is False
+        assert state["queue"] is None
+        assert state["active"] is False
+
+    assert state["lines"] == ["again"]
+
+
+def test_reply_slot_get_timeout_raises_empty() -> None:
+    import uagent.tools.human_ask_tool as m
+
+    slot = m._ReplySlot()
+    with pytest.raises(queue.Empty):
+        slot.get(timeout=0.05)
+    with pytest.raises(queue.Empty):
+        slot.get(block=False)
+
+    slot.put("a")
+    slot.put("b")
+    assert slot.get(timeout=1) == "a"
+
+
+def test_split_keep_lines_normalizes_all_line_breaks() -> None:
+    import uagent.tools.human_ask_tool as m
+
+    assert m._split_keep_lines("a\r\nb\rc\n\nd") == ["a", "b", "c", "", "d"]
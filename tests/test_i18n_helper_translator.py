@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from uagent.tools import i18n_helper
+
+
+def _make_tool(tmp_path, data: dict) -> str:
+    py = tmp_path / "dummy_tool.py"
+    py.write_text("", encoding="utf-8")
+    (tmp_path / "dummy_tool.json").write_text(json.dumps(data), encoding="utf-8")
+    return str(py)
+
+
+def test_translator_rebinds_when_locale_env_changes(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    py = _make_tool(tmp_path, {"en": {"k": "hello"}, "ja": {"k": "konnichiwa"}})
+    i18n_helper.clear_tool_i18n_cache()
+    _ = i18n_helper.make_tool_translator(py)
+
+    monkeypatch.setenv("UAGENT_LANG", "en")
+    assert _("k", default="x") == "hello"
+
+    monkeypatch.setenv("UAGENT_LANG", "ja")
+    assert _("k", default="x") == "konnichiwa"
+
+    monkeypatch.setenv("UAGENT_LANG", "fr")
+    assert _("k", default="x") == "hello"
+    assert _("missing", default="x") == "x"
+
+
+def test_translator_rebinds_after_cache_clear(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("UAGENT_LANG", "en")
+    py = _make_tool(tmp_path, {"en": {"k": "v1"}})
+    i18n_helper.clear_tool_i18n_cache()
+    _ = i18n_helper.make_tool_translator(py)
+    assert _("k", default="x") == "v1"
+
+    (tmp_path / "dummy_tool.json").write_text(
+        json.dumps({"en": {"k": "v2"}}), encoding="utf-8"
+    )
+    assert _("k", default="x") == "v1"
+
+    i18n_helper.clear_tool_i18n_cache()
+    assert _("k", default="x") == "v2"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from uagent.utils.scan_filters import is_ignored_path
+
+
+def _make_tree(root: Path) -> None:
+    for rel in (
+        "a.py",
+        "README.md",
+        "src/pkg/mod.py",
+        "src/pkg/sub/deep.py",
+        "src/pkg/data.txt",
+        "docs/guide.md",
+        ".git/objects/x.py",
+        "node_modules/lib/index.py",
+        "src/.hidden/h.py",
+        "src/__pycache__/c.py",
+    ):
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x", encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["**/*.py", "src/**/*.py", "src/**", "**/*.md", "src/pkg/**/deep.py", "**"],
+)
+def test_walk_recursive_pattern_matches_glob_after_filtering(
+    repo_tmp_path: Path, pattern: str
+) -> None:
+    from uagent.tools.index_files_tool import _walk_recursive_pattern
+
+    root = repo_tmp_path / "idx_tree"
+    _make_tree(root)
+    root_abs = str(root.resolve())
+
+    expected = sorted(
+        f
+        for f in glob.glob(os.path.join(glob.escape(root_abs), pattern), recursive=True)
+        if os.path.isfile(f) and not is_ignored_path(os.path.relpath(f, root_abs))
+    )
+    walked = _walk_recursive_pattern(root_abs, pattern)
+    assert walked is not None
+    assert sorted(walked) == expected
+
+
+def test_walk_recursive_pattern_defers_flat_patterns_to_glob(
+    repo_tmp_path: Path,
+) -> None:
+    from uagent.tools.index_files_tool import _walk_recursive_pattern
+
+    assert _walk_recursive_pattern(str(repo_tmp_path), "*.py") is None
+    assert _walk_recursive_pattern(str(repo_tmp_path), "../**/*.py") is None
+
+
+def test_run_tool_indexes_files_concurrently_and_counts_errors(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    import uagent.tools.index_files_tool as m
+
+    root = repo_tmp_path / "idx_run"
+    _make_tree(root)
+
+    seen: list[str] = []
+    lock = threading.Lock()
+
+    def fake_sync_file(fpath: str, root_dir: str) -> None:
+        with lock:
+            seen.append(os.path.basename(fpath))
+        if fpath.endswith("deep.py"):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(m, "sync_file", fake_sync_file)
+    monkeypatch.setenv("UAGENT_INDEX_WORKERS", "3")
+    monkeypatch.setenv("UAGENT_LANG", "en")
+
+    out = m.run_tool({"pattern": "**/*.py", "root_path": str(root)})
+
+    assert sorted(seen) == ["a.py", "deep.py", "mod.py"]
+    assert "Total files: 3" in out
+    assert "Success: 2" in out
+    assert "Failed: 1" in out
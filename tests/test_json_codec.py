@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+_SAMPLE = {
+    "mcp_servers": [
+        {"name": "ローカル", "url": "http://x/mcp", "args": [], "env": {}},
+        {"name": "b", "command": "run", "args": ["-v", 1, 2.5, True, None]},
+    ]
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_match_stdlib_layout(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    from uagent.utils import json_codec as m
+
+    if not use_orjson:
+        monkeypatch.setattr(m, "orjson", None)
+    elif m.orjson is None:
+        pytest.skip("orjson not installed")
+
+    pretty = m.json_dumps(_SAMPLE, pretty=True)
+    assert pretty == json.dumps(_SAMPLE, ensure_ascii=False, indent=2)
+    assert json.loads(m.json_dumps(_SAMPLE)) == _SAMPLE
+    assert m.json_loads(pretty.encode("utf-8")) == _SAMPLE
+
+
+def test_json_dumps_falls_back_for_values_orjson_rejects() -> None:
+    from uagent.utils import json_codec as m
+
+    big = {"n": 1 << 70}
+    assert json.loads(m.json_dumps(big)) == big
+    assert json.loads(m.json_dumps(big, pretty=True)) == big
+
+
+def test_orjson_differences_match_module_docs() -> None:
+    from uagent.utils import json_codec as m
+
+    if m.orjson is None:
+        pytest.skip("orjson not installed")
+
+    assert m.json_dumps([float("nan"), float("inf"), 1e16]) == "[null,null,1e16]"
+    with pytest.raises(json.JSONDecodeError):
+        m.json_loads("[NaN]")
+    assert m.json_loads(str(1 << 70)) == float(1 << 70)
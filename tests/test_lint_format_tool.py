@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_tool_probe_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    import uagent.tools.lint_format_tool as m
+
+    calls: list[str] = []
+
+    def fake_exec(command, cwd):
+        calls.append(" ".join(command))
+        return "", "", 0, None
+
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_path_python_is_current", lambda: False)
+    monkeypatch.setattr(m, "_TOOL_EXISTS_CACHE", {})
+
+    assert m._tool_exists_py("ruff") is True
+    assert m._tool_exists_py("ruff") is True
+    assert m._tool_exists_mdformat() is True
+    assert m._tool_exists_mdformat() is True
+    assert calls == ["python -m ruff --version", "python -m mdformat --help"]
+
+    m._pip_install("ruff")
+    assert m._tool_exists_py("ruff") is True
+    assert calls[-1] == "python -m ruff --version"
+
+
+def test_tool_probe_uses_find_spec_for_current_python(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.lint_format_tool as m
+
+    def fail_exec(command, cwd):
+        raise AssertionError(command)
+
+    monkeypatch.setattr(m, "_cmd_exec_json", fail_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_path_python_is_current", lambda: True)
+    monkeypatch.setattr(m, "_TOOL_EXISTS_CACHE", {})
+
+    assert m._tool_exists_py("json") is True
+    assert m._tool_exists_py("no_such_module_xyz") is False
+
+
+def test_check_mode_runs_tools_concurrently_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import json
+    import threading
+
+    import uagent.tools.lint_format_tool as m
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_exec(command, cwd):
+        barrier.wait()
+        return " ".join(command), "", 0, None
+
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+
+    out = json.loads(m.run_tool({"tools": ["black", "ruff"], "targets": ["."]}))
+    assert out["ok"] is True
+    assert [r["tool"] for r in out["results"]] == ["black", "ruff"]
+    assert out["results"][1]["command"].startswith("python -m ruff check")
+
+
+def _overlap_tracking_exec(returncode_for=lambda command: 0):
+    """Fake _cmd_exec_json that holds each call briefly and records the peak
+    number of calls in flight."""
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_exec(command, cwd):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["active"] -= 1
+        return "", "", returncode_for(command), None
+
+    return fake_exec, state
+
+
+@pytest.mark.parametrize("mode, expected_peak", [("fix", 1), ("check", 2)])
+def test_tools_overlap_only_in_check_mode(
+    monkeypatch: pytest.MonkeyPatch, mode: str, expected_peak: int
+) -> None:
+    import json
+
+    import uagent.tools.lint_format_tool as m
+
+    fake_exec, state = _overlap_tracking_exec(
+        lambda command: 1 if "black" in command else 0
+    )
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m, "_human_confirm", lambda msg: True)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+
+    out = json.loads(
+        m.run_tool({"tools": ["black", "mypy", "nope"], "mode": mode, "targets": ["."]})
+    )
+    assert out["ok"] is False
+    assert [r["tool"] for r in out["results"]] == ["black", "mypy", "nope"]
+    assert out["results"][2]["error"] == "unsupported tool"
+    assert state["peak"] == expected_peak
+
+
+def test_tool_argv_prefers_standalone_executable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.lint_format_tool as m
+
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+    monkeypatch.setattr(m, "_TOOL_EXISTS_CACHE", {})
+    monkeypatch.setattr(
+        m.shutil, "which", lambda name: "/opt/bin/ruff" if name == "ruff" else None
+    )
+
+    assert m._tool_argv("ruff") == ["/opt/bin/ruff"]
+    assert m._tool_argv("black") == ["python", "-m", "black"]
+    assert m._tool_exists_py("ruff") is True
+
+
+def test_targets_pass_through_unchanged(
+    repo_tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    import uagent.tools.lint_format_tool as m
+
+    stub = repo_tmp_path / "pkg" / "stub.pyi"
+    stub.parent.mkdir(parents=True)
+    stub.write_text("def f() -> int: ...\n", encoding="utf-8")
+
+    commands: dict[str, list[str]] = {}
+
+    def fake_exec(command, cwd):
+        commands[command[2]] = list(command)
+        return "", "", 0, None
+
+    def no_walk(*a, **kw):
+        raise AssertionError("targets must not be walked in Python")
+
+    monkeypatch.setattr(m.os, "walk", no_walk)
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+
+    # Directories go to each tool as-is so ruff/black apply their own file
+    # discovery (.gitignore, extend-include, excludes).
+    out = json.loads(
+        m.run_tool(
+            {
+                "tools": ["ruff", "black", "mypy"],
+                "targets": [str(stub.parent), str(stub)],
+            }
+        )
+    )
+    assert out["ok"] is True
+    for tool in ("ruff", "black", "mypy"):
+        assert commands[tool][-2:] == [str(stub.parent), str(stub)]
+        assert "--force-exclude" not in commands[tool]
+
+
+@pytest.mark.parametrize("arg", ["a&&b", "a||b", "x;y", "$(rm)", "`id`", "!a", ">o"])
+def test_reject_if_meta_rejects_shell_metacharacters(arg: str) -> None:
+    import uagent.tools.lint_format_tool as m
+
+    assert m._reject_if_meta(arg) is not None
+
+
+def test_reject_if_meta_allows_plain_arguments() -> None:
+    import uagent.tools.lint_format_tool as m
+
+    assert m._reject_if_meta("--line-length=88") is None
+    assert m._reject_if_meta("") is None
+
+
+def test_auto_detection_probes_all_tools_in_one_subprocess(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import json
+
+    import uagent.tools.lint_format_tool as m
+
+    calls: list[list[str]] = []
+
+    def fake_exec(argv, cwd):
+        calls.append(list(argv))
+        if argv[:2] == ["python", "-c"]:
+            found = {name: name in ("ruff", "mdformat") for name in argv[3:]}
+            return json.dumps(found) + "\n", "", 0, None
+        return "", "", 0, None
+
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_path_python_is_current", lambda: False)
+    monkeypatch.setattr(m, "_TOOL_EXISTS_CACHE", {})
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+
+    out = json.loads(m.run_tool({"targets": ["README.md"]}))
+    assert [r["tool"] for r in out["results"]] == ["ruff", "mdformat"]
+    probes = [c for c in calls if c[:2] == ["python", "-c"]]
+    assert len(probes) == 1
+    assert probes[0][3:] == ["ruff", "black", "mypy", "mdformat"]
+    assert not any("--version" in c or "--help" in c for c in calls)
+
+
+def test_mdformat_runs_as_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+    import sys
+
+    import uagent.tools.lint_format_tool as m
+
+    calls: list[list[str]] = []
+    real_stdout = sys.stdout
+
+    def fake_exec(argv, cwd):
+        assert sys.stdout is real_stdout
+        calls.append(list(argv))
+        return "", "", 0, None
+
+    monkeypatch.setattr(m, "_cmd_exec_json", fake_exec)
+    monkeypatch.setattr(m.shutil, "which", lambda name: None)
+    monkeypatch.setattr(m, "_TOOL_ARGV_CACHE", {})
+
+    out = json.loads(m.run_tool({"tools": ["mdformat"], "targets": ["README.md"]}))
+    assert out["ok"] is True
+    assert len(calls) == 1
+    assert calls[0][:4] == ["python", "-m", "mdformat", "--check"]
+    assert calls[0][4].endswith("README.md")
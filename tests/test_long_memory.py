@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+
+def _write_records(path: Path, notes: list[str]) -> None:
+    path.write_text(
+        "".join(json.dumps({"ts": 0, "note": n}) + "\n" for n in notes),
+        encoding="utf-8",
+    )
+
+
+def test_load_records_is_cached_until_file_changes(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    mem = repo_tmp_path / "mem.jsonl"
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(mem))
+    _write_records(mem, ["a", "b"])
+    with open(mem, "a", encoding="utf-8") as f:
+        f.write("{broken\n\n")
+
+    first = m.load_long_memory_records()
+    assert [r["note"] for r in first] == ["a", "b"]
+
+    first.pop()
+    assert [r["note"] for r in m.load_long_memory_records()] == ["a", "b"]
+
+    m.append_long_memory("c")
+    assert [r["note"] for r in m.load_long_memory_records()] == ["a", "b", "c"]
+
+    assert m.delete_long_memory_entry(0)
+    assert [r["note"] for r in m.load_long_memory_records()] == ["b", "c"]
+
+
+def test_load_raw_returns_tail_when_truncated(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    mem = repo_tmp_path / "mem.jsonl"
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(mem))
+    monkeypatch.setattr(m, "get_max_memory_bytes", lambda: 60)
+    _write_records(mem, [f"note-{i}" for i in range(10)])
+
+    raw = m.load_long_memory_raw()
+    body, _, note = raw.partition("\n[")
+    assert "note-9" in body
+    assert "note-0" not in body
+    assert all(json.loads(line)["note"] for line in body.splitlines())
+    assert "60" in note
+
+
+def test_load_raw_missing_file(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(repo_tmp_path / "none.jsonl"))
+    assert m.load_long_memory_raw() == m._(
+        "msg.no_memory", default="(no long-term memory yet)"
+    )
+    assert m.load_long_memory_records() == []
+
+
+def test_delete_uses_tombstones_then_compacts(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    mem = repo_tmp_path / "mem.jsonl"
+    sidecar = Path(str(mem) + ".deleted")
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(mem))
+    _write_records(mem, [f"n{i}" for i in range(20)])
+    original = mem.read_bytes()
+
+    assert m.delete_long_memory_entry(3)
+    assert m.delete_long_memory_entry(3)
+    assert mem.read_bytes() == original
+    assert sidecar.exists()
+    notes = [r["note"] for r in m.load_long_memory_records()]
+    assert len(notes) == 18
+    assert "n3" not in notes and "n4" not in notes
+    raw = m.load_long_memory_raw()
+    assert '"n3"' not in raw and '"n5"' in raw
+
+    assert m.delete_long_memory_entry(0)
+    assert not sidecar.exists()
+    notes = [r["note"] for r in m.load_long_memory_records()]
+    assert notes == [f"n{i}" for i in range(1, 20) if i not in (3, 4)]
+    assert len(mem.read_text(encoding="utf-8").splitlines()) == 17
+    assert not list(repo_tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_rewrite_keeps_file_mode(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    mem = repo_tmp_path / "mem.jsonl"
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(mem))
+    _write_records(mem, ["a", "b"])
+    os.chmod(mem, 0o644)
+
+    assert m.update_long_memory_entry(0, "z")
+    assert [r["note"] for r in m.load_long_memory_records()] == ["z", "b"]
+    assert stat.S_IMODE(os.stat(mem).st_mode) == 0o644
+
+
+def test_stale_tombstone_is_ignored_after_external_rewrite(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import long_memory as m
+
+    mem = repo_tmp_path / "mem.jsonl"
+    monkeypatch.setenv("UAGENT_MEMORY_FILE", str(mem))
+    _write_records(mem, [f"n{i}" for i in range(20)])
+    assert m.delete_long_memory_entry(5)
+
+    _write_records(mem, [f"x{i}" for i in range(20)])
+    assert len(m.load_long_memory_records()) == 20
+
+    assert m.update_long_memory_entry(0, "changed")
+    assert not Path(str(mem) + ".deleted").exists()
+    assert m.load_long_memory_records()[0]["note"] == "changed"
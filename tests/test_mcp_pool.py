@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_acquire_client_closes_least_recently_used_past_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from uagent.tools import mcp_pool
+
+    events: list[str] = []
+
+    class FakeClient:
+        def __init__(self, name: str):
+            self.name = name
+
+        async def __aenter__(self):
+            events.append(f"enter:{self.name}")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append(f"exit:{self.name}")
+
+    monkeypatch.setattr(mcp_pool, "MAX_POOL_SIZE", 2)
+
+    async def acquire(name: str) -> FakeClient:
+        return await mcp_pool.acquire_client(("k", name), lambda: FakeClient(name))
+
+    try:
+        a = mcp_pool.run_coro(acquire("a"))
+        mcp_pool.run_coro(acquire("b"))
+        assert mcp_pool.run_coro(acquire("a")) is a  # a is now most recent
+        mcp_pool.run_coro(acquire("c"))
+        assert events == ["enter:a", "enter:b", "enter:c", "exit:b"]
+        assert list(mcp_pool._POOL) == [("k", "a"), ("k", "c")]
+    finally:
+        mcp_pool.shutdown_pool()
+
+    assert sorted(events[-2:]) == ["exit:a", "exit:c"]
+
+
+def test_lru_cap_skips_clients_with_calls_in_flight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+
+    from uagent.tools import mcp_pool
+
+    events: list[str] = []
+
+    class FakeClient:
+        def __init__(self, name: str):
+            self.name = name
+
+        async def __aenter__(self):
+            events.append(f"enter:{self.name}")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append(f"exit:{self.name}")
+
+    monkeypatch.setattr(mcp_pool, "MAX_POOL_SIZE", 1)
+
+    async def scenario() -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_op(client: FakeClient) -> str:
+            started.set()
+            await release.wait()
+            events.append(f"done:{client.name}")
+            return client.name
+
+        async def quick_op(client: FakeClient) -> str:
+            return client.name
+
+        def call(name: str, op):
+            return mcp_pool.call_pooled(("k", name), lambda: FakeClient(name), op)
+
+        slow = asyncio.ensure_future(call("a", slow_op))
+        await started.wait()
+        assert await call("b", quick_op) == "b"
+        assert "exit:a" not in events  # a is busy, so the pool runs over cap
+        release.set()
+        assert await slow == "a"
+        assert await call("c", quick_op) == "c"
+
+    try:
+        mcp_pool.run_coro(scenario())
+        assert events == [
+            "enter:a",
+            "enter:b",
+            "done:a",
+            "enter:c",
+            "exit:a",
+            "exit:b",
+        ]
+    finally:
+        mcp_pool.shutdown_pool()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def test_load_config_cached_reuses_parse_until_file_changes(repo_tmp_path) -> None:
+    import os
+
+    from uagent.tools import mcp_servers_shared as m
+
+    path = repo_tmp_path / "mcp_servers.json"
+    path.write_text(json.dumps({"mcp_servers": [{"name": "a"}]}), encoding="utf-8")
+
+    first = m.load_config_cached(str(path))
+    assert m.load_config_cached(str(path)) is first
+
+    path.write_text(json.dumps({"mcp_servers": [{"name": "bb"}]}), encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = m.load_config_cached(str(path))
+    assert second["mcp_servers"][0]["name"] == "bb"
+
+    m.invalidate_config_cache(str(path))
+    assert m.load_config_cached(str(path)) is not second
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        m.load_config_cached(str(path))
+
+
+def test_mcp_servers_actions_do_not_mutate_cached_config(repo_tmp_path) -> None:
+    from uagent.tools import mcp_servers_shared as shared
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = repo_tmp_path / "mcp_servers.json"
+    path.write_text(
+        json.dumps({"mcp_servers": [{"name": "a", "url": "http://a/mcp"}]}),
+        encoding="utf-8",
+    )
+    cached = shared.load_config_cached(str(path))
+
+    out = json.loads(
+        run_tool(
+            {"action": "add", "name": "b", "url": "http://b/mcp", "path": str(path)}
+        )
+    )
+    assert out["ok"] is True
+    assert [s["name"] for s in cached["mcp_servers"]] == ["a"]
+
+    listed = json.loads(run_tool({"action": "list", "path": str(path)}))
+    assert [s["name"] for s in listed["servers"]] == ["a", "b"]
+
+
+def test_default_path_is_memoized_per_env(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import mcp_servers_shared as m
+
+    first = repo_tmp_path / "a.json"
+    second = repo_tmp_path / "b.json"
+    m.invalidate_default_path_cache()
+    monkeypatch.setenv("UAGENT_MCP_CONFIG", str(first))
+    assert m.get_default_mcp_config_path() == str(first)
+    assert m._resolve_default_mcp_config_path.cache_info().hits == 0
+    assert m.get_default_mcp_config_path() == str(first)
+    assert m._resolve_default_mcp_config_path.cache_info().hits == 1
+
+    monkeypatch.setenv("UAGENT_MCP_CONFIG", str(second))
+    assert m.get_default_mcp_config_path() == str(second)
+
+    m.invalidate_default_path_cache()
+    assert m._resolve_default_mcp_config_path.cache_info().currsize == 0
+
+
+def test_default_path_follows_cwd_for_relative_env(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import mcp_servers_shared as m
+
+    one = repo_tmp_path / "one"
+    two = repo_tmp_path / "two"
+    one.mkdir()
+    two.mkdir()
+    m.invalidate_default_path_cache()
+    monkeypatch.setenv("UAGENT_MCP_CONFIG", "mcp.json")
+    monkeypatch.chdir(one)
+    assert m.get_default_mcp_config_path() == str(one.absolute() / "mcp.json")
+    monkeypatch.chdir(two)
+    assert m.get_default_mcp_config_path() == str(two.absolute() / "mcp.json")
+
+
+def test_ensure_template_writes_once_and_keeps_existing(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from uagent.tools import mcp_servers_shared as m
+
+    monkeypatch.setenv("UAGENT_STATE_DIR", str(repo_tmp_path / "state"))
+    path = Path(m.ensure_mcp_config_template())
+    assert path.read_text(encoding="utf-8") == '{\n  "mcp_servers": []\n}'
+
+    path.write_text('{"mcp_servers": [{"name": "x"}]}', encoding="utf-8")
+    assert m.ensure_mcp_config_template() == str(path)
+    assert json.loads(path.read_text(encoding="utf-8"))["mcp_servers"] == [
+        {"name": "x"}
+    ]
+
+
+def test_load_servers_by_name_indexes_until_file_changes(repo_tmp_path: Path) -> None:
+    import os
+
+    from uagent.tools import mcp_servers_shared as m
+
+    cfg = repo_tmp_path / "mcp_servers_by_name.json"
+    cfg.write_text(
+        json.dumps(
+            {
+                "mcp_servers": [
+                    {"name": "a", "url": "http://a"},
+                    "junk",
+                    {"name": "a", "url": "http://dup"},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    first = m.load_servers_by_name(str(cfg))
+    assert first == {"a": {"name": "a", "url": "http://a"}}
+    assert m.load_servers_by_name(str(cfg)) is first
+
+    cfg.write_text(
+        json.dumps({"mcp_servers": [{"name": "b", "url": "http://bb"}]}),
+        encoding="utf-8",
+    )
+    st = os.stat(cfg)
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = m.load_servers_by_name(str(cfg))
+    assert second == {"b": {"name": "b", "url": "http://bb"}}
+
+    m.invalidate_config_cache(str(cfg))
+    assert m.load_servers_by_name(str(cfg)) is not second
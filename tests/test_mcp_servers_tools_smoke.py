@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 from pathlib import Path
 
+import pytest
+
 
 def _write_config(path: Path, servers: list[dict]) -> None:
     path.write_text(
@@ -138,3 +142,100 @@ def test_mcp_servers_add_list_validate_set_default_remove_smoke(
     data_after_remove = _load_config(path)
     names = [row["name"] for row in data_after_remove["mcp_servers"]]
     assert names == ["third", "first"]
+
+
+def test_mcp_servers_add_identical_entry_skips_write(repo_tmp_path: Path) -> None:
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = repo_tmp_path / "mcp_servers.json"
+    args = {
+        "action": "add",
+        "name": "only",
+        "url": "http://only.test/mcp",
+        "path": str(path),
+        "replace": True,
+    }
+    first = json.loads(run_tool(args))
+    assert first["ok"] is True
+    assert _load_config(path)["mcp_servers"][0]["name"] == "only"
+
+    stamp = os.stat(path).st_mtime_ns
+    again = json.loads(run_tool(args))
+    assert again["ok"] is True
+    assert os.stat(path).st_mtime_ns == stamp
+    assert [p.name for p in repo_tmp_path.iterdir()] == ["mcp_servers.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_mcp_servers_save_keeps_file_mode(repo_tmp_path: Path) -> None:
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = repo_tmp_path / "mcp_servers.json"
+    _write_config(path, [])
+    os.chmod(path, 0o644)
+
+    out = json.loads(
+        run_tool(
+            {
+                "action": "add",
+                "name": "a",
+                "url": "http://a.test/mcp",
+                "path": str(path),
+            }
+        )
+    )
+    assert out["ok"] is True
+    assert _load_config(path)["mcp_servers"][0]["name"] == "a"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_mcp_servers_validate_reports_duplicate_names(repo_tmp_path: Path) -> None:
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = repo_tmp_path / "mcp_servers.json"
+    _write_config(
+        path,
+        [{"name": n, "url": f"http://{i}.test/mcp"} for i, n in enumerate("abaca")],
+    )
+
+    out = json.loads(run_tool({"action": "validate", "path": str(path)}))
+    assert out["overall"] == "FAIL"
+    assert len(out["errors"]) == 1
+    assert "'a'" in out["errors"][0] and "3" in out["errors"][0]
+
+    listed = json.loads(run_tool({"action": "list", "path": str(path)}))
+    assert len([w for w in listed["warnings"] if "'a'" in w]) == 1
+
+
+def test_mcp_servers_missing_config_reports_per_action(repo_tmp_path: Path) -> None:
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = str(repo_tmp_path / "absent.json")
+
+    listed = json.loads(run_tool({"action": "list", "path": path}))
+    assert listed["servers"] == []
+    assert any(path in w for w in listed["warnings"])
+
+    out = json.loads(run_tool({"action": "validate", "path": path}))
+    assert out["overall"] == "FAIL"
+    assert any(path in e for e in out["errors"])
+
+
+def test_mcp_servers_list_default_only_validates_default(repo_tmp_path: Path) -> None:
+    from uagent.tools.mcp_servers_tool import run_tool
+
+    path = repo_tmp_path / "mcp_servers.json"
+    _write_config(
+        path,
+        [{"name": "a", "url": "http://a.test/mcp"}, {"name": "", "url": "http://b"}],
+    )
+
+    full = json.loads(run_tool({"action": "list", "path": str(path)}))
+    assert len(full["warnings"]) == 2
+
+    out = json.loads(
+        run_tool({"action": "list", "path": str(path), "default_only": True})
+    )
+    assert out["count"] == 2
+    assert [s["name"] for s in out["servers"]] == ["a"]
+    assert out["warnings"] == []
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _write_config(path: Path, servers: list[dict]) -> None:
+    path.write_text(json.dumps({"mcp_servers": servers}), encoding="utf-8")
+
+
+def test_run_tool_resolves_server_name_from_config(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import uagent.tools.mcp_tools_list_tool as m
+
+    cfg = repo_tmp_path / "mcp_servers.json"
+    _write_config(
+        cfg,
+        [
+            {"name": "local", "command": "srv", "args": ["-v", 1], "env": {"K": 2}},
+            {"name": "web", "url": "http://web/mcp", "protocol_mode": "Legacy"},
+        ],
+    )
+    monkeypatch.setenv("UAGENT_MCP_CONFIG", str(cfg))
+
+    calls: list[tuple] = []
+
+    async def fake_stdio(command, args, env, protocol_mode="auto"):
+        calls.append(("stdio", command, args, env, protocol_mode))
+        return {"tools_list": {"tools": []}}
+
+    async def fake_http(url, headers=None, protocol_mode="auto"):
+        calls.append(("http", url, protocol_mode))
+        return {"tools_list": {"tools": []}}
+
+    monkeypatch.setattr(m, "_mcp_tools_list_stdio", fake_stdio)
+    monkeypatch.setattr(m, "_mcp_tools_list_http", fake_http)
+    monkeypatch.setattr(m, "_TOOLS_CACHE", {})
+
+    json.loads(m.run_tool({"server_name": "local"}))
+    json.loads(m.run_tool({"server_name": "web"}))
+    assert calls == [
+        ("stdio", "srv", ["-v", "1"], {"K": "2"}, "auto"),
+        ("http", "http://web/mcp", "legacy"),
+    ]
+
+    out = json.loads(m.run_tool({"server_name": "missing"}))
+    assert out["ok"] is False
+
+
+def test_run_tool_reuses_pooled_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    import uagent.tools.mcp_pool as pool
+    import uagent.tools.mcp_tools_list_tool as m
+
+    events: list[str] = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            self.url = kwargs.get("url")
+            self.initialize_result = {"serverInfo": {"name": "fake"}}
+            self.protocol_info = {"mode": kwargs.get("protocol_mode")}
+
+        async def __aenter__(self):
+            events.append("enter")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append("exit")
+
+        async def list_tools(self):
+            events.append("list")
+            return {"result": {"tools": [{"name": "t", "description": "d"}]}}
+
+    monkeypatch.setattr(m, "MCPClient", FakeClient)
+    monkeypatch.setattr(m, "_TOOLS_CACHE", {})
+
+    try:
+        for _ in range(2):
+            out = json.loads(
+                m.run_tool({"url": "http://list-pool.example", "refresh": True})
+            )
+            assert out["tools_list"]["tools"][0]["name"] == "t"
+            assert out["initialize"] == {"serverInfo": {"name": "fake"}}
+        assert events == ["enter", "list", "list"]
+    finally:
+        pool.shutdown_pool()
+
+    assert events[-1] == "exit"
+
+
+def test_run_tool_serves_listing_from_cache_within_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import uagent.tools.mcp_tools_list_tool as m
+
+    calls: list[str] = []
+
+    async def fake_http(url, headers=None, protocol_mode="auto"):
+        calls.append(url)
+        return {"url": url, "tools_list": {"tools": [{"name": str(len(calls))}]}}
+
+    monkeypatch.setattr(m, "_mcp_tools_list_http", fake_http)
+    monkeypatch.setattr(m, "_TOOLS_CACHE", {})
+
+    def names(args: dict) -> list[str]:
+        out = json.loads(m.run_tool({"url": "http://ttl.example/mcp", **args}))
+        return [t["name"] for t in out["tools_list"]["tools"]]
+
+    assert names({}) == ["1"]
+    assert names({}) == ["1"]
+    assert names({"refresh": True}) == ["2"]
+    assert names({"cache_ttl": 0}) == ["3"]
+    assert names({"protocol_mode": "legacy"}) == ["4"]
+    assert len(calls) == 4
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_bounded_matches_dumps_and_truncates(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    import uagent.tools.mcp_tools_list_tool as m
+    from uagent.utils import json_codec
+
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    obj = {
+        "url": "http://x/mcp",
+        "tools_list": {"tools": [{"name": f"ツール{i}"} for i in range(50)]},
+    }
+    for pretty in (True, False):
+        full = json_codec.json_dumps(obj, pretty=pretty)
+        assert m._dump_bounded(obj, len(full), pretty) == full
+
+        cut = json.loads(m._dump_bounded(obj, 300, pretty))
+        kept = cut["tools_list"]["tools"]
+        assert cut["truncated"] is True
+        assert cut["tools_omitted"] == 50 - len(kept)
+        assert 0 < len(kept) < 50
+        assert kept == obj["tools_list"]["tools"][: len(kept)]
+        assert len(m._dump_bounded(obj, 300, pretty)) <= 300
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def test_child_script_is_written_once_and_reused(
+    repo_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import uagent.tools.playwright_inspector_tool as m
+
+    monkeypatch.setenv("UAGENT_CACHE_DIR", str(repo_tmp_path / "cache"))
+    monkeypatch.setattr(m, "_CHILD_SCRIPT_PATH", None)
+
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0, stdout="done", stderr="")
+
+    monkeypatch.setattr(m.subprocess, "run", fake_run)
+
+    for _ in range(2):
+        assert "done" in m.run_tool({"url": "about:blank", "prefix": "p"})
+
+    script = Path(calls[0][1])
+    assert calls[0][0] == sys.executable
+    assert calls[1][1] == str(script)
+    assert script.parent == repo_tmp_path / "cache"
+    assert script.read_text(encoding="utf-8") == m._CHILD_SCRIPT
+    payload = json.loads(calls[0][2])
+    assert payload["prefix"] == "p"
+    assert payload["pkg_root"] == os.path.dirname(
+        os.path.dirname(os.path.dirname(m.__file__))
+    )
+    assert sorted(p.name for p in script.parent.iterdir()) == [script.name]
+    assert not list(Path.cwd().glob("temp_inspector_*.py"))